@@ -123,9 +123,12 @@ def _upload_cli(args):
     summary = ImportSummary()
 
     # Process all input files/directories
-    _process_input(enex_uploader, args.enex_input, summary, 
-                   note_title=getattr(args, 'note', None), 
-                   note_index=getattr(args, 'note_index', None))
+    try:
+        _process_input(enex_uploader, args.enex_input, summary, 
+                       note_title=getattr(args, 'note', None), 
+                       note_index=getattr(args, 'note_index', None))
+    finally:
+        enex_uploader.close()
 
     # Mark import as complete
     summary.complete()
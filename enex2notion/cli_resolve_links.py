@@ -679,35 +679,40 @@ def resolve_links_command(wrapper: NotionAPIWrapper, root_id: str, args):
     workers = getattr(args, 'workers', 3)
     print(f"\n✓ Processing {len(pages_to_process)} pages with {workers} worker(s)...\n")
     
-    # Process pages (parallel or sequential)
-    if workers > 1:
-        # Parallel processing
-        with ThreadPoolExecutor(max_workers=workers) as executor:
-            futures = {executor.submit(process_page, pid, title): (pid, title) for pid, title in pages_to_process}
+    # Process pages (parallel or sequential); entries buffered so far are
+    # written even if processing is interrupted
+    try:
+        if workers > 1:
+            # Parallel processing
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = {executor.submit(process_page, pid, title): (pid, title) for pid, title in pages_to_process}
             
+                with tqdm(total=len(pages_to_process), desc="Processing", unit="page") as pbar:
+                    for future in as_completed(futures):
+                        page_stats = future.result()
+                        with stats_lock:
+                            stats.total_pages_scanned += 1
+                            stats.total_links_found += page_stats["links_found"]
+                            stats.links_matched += page_stats["links_matched"]
+                            stats.links_unmatched += page_stats["links_unmatched"]
+                            if page_stats["links_found"] > 0:
+                                stats.pages_with_links += 1
+                        pbar.update(1)
+        else:
+            # Sequential processing
             with tqdm(total=len(pages_to_process), desc="Processing", unit="page") as pbar:
-                for future in as_completed(futures):
-                    page_stats = future.result()
-                    with stats_lock:
-                        stats.total_pages_scanned += 1
-                        stats.total_links_found += page_stats["links_found"]
-                        stats.links_matched += page_stats["links_matched"]
-                        stats.links_unmatched += page_stats["links_unmatched"]
-                        if page_stats["links_found"] > 0:
-                            stats.pages_with_links += 1
+                for pid, title in pages_to_process:
+                    page_stats = process_page(pid, title)
+                    stats.total_pages_scanned += 1
+                    stats.total_links_found += page_stats["links_found"]
+                    stats.links_matched += page_stats["links_matched"]
+                    stats.links_unmatched += page_stats["links_unmatched"]
+                    if page_stats["links_found"] > 0:
+                        stats.pages_with_links += 1
                     pbar.update(1)
-    else:
-        # Sequential processing
-        with tqdm(total=len(pages_to_process), desc="Processing", unit="page") as pbar:
-            for pid, title in pages_to_process:
-                page_stats = process_page(pid, title)
-                stats.total_pages_scanned += 1
-                stats.total_links_found += page_stats["links_found"]
-                stats.links_matched += page_stats["links_matched"]
-                stats.links_unmatched += page_stats["links_unmatched"]
-                if page_stats["links_found"] > 0:
-                    stats.pages_with_links += 1
-                pbar.update(1)
+    finally:
+        # Write the buffered link-failure entries
+        tracker.flush()
     
     # Print summary
     print()
@@ -1,4 +1,5 @@
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from enex2notion.enex_parser import parse_all_notes
@@ -26,6 +27,7 @@ class DoneFile(object):
         self.path = path
         self.done_hashes = set()
         self.databases = {}  # notebook_name -> database_id
+        self._file = None  # Append handle, opened on first write
 
         # Ensure the parent directory exists
         path.parent.mkdir(parents=True, exist_ok=True)
@@ -52,11 +54,7 @@ class DoneFile(object):
     def add(self, note_hash):
         """Add a successfully uploaded note hash."""
         self.done_hashes.add(note_hash)
-
-        # Ensure parent directory exists
-        self.path.parent.mkdir(parents=True, exist_ok=True)
-        with open(self.path, "a") as f:
-            f.write(f"{note_hash}\n")
+        self._write(f"{note_hash}\n")
     
     def get_database(self, notebook_name):
         """Get the database ID for a notebook, if it exists.
@@ -69,11 +67,27 @@ class DoneFile(object):
     def add_database(self, notebook_name, database_id):
         """Record a database creation for a notebook."""
         self.databases[notebook_name] = database_id
-        
-        # Ensure parent directory exists
-        self.path.parent.mkdir(parents=True, exist_ok=True)
-        with open(self.path, "a") as f:
-            f.write(f"DB:{notebook_name}:{database_id}\n")
+        self._write(f"DB:{notebook_name}:{database_id}\n")
+
+    def close(self):
+        """Close the underlying file handle."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _write(self, line):
+        """Append a line through a single long-lived handle.
+
+        The handle is opened once instead of per record; each line is still
+        flushed to the OS immediately so an interrupted run never re-uploads
+        notes that already made it to Notion.
+        """
+        if self._file is None:
+            # Ensure parent directory exists
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._file = open(self.path, "a")
+        self._file.write(line)
+        self._file.flush()
 
 
 class EnexUploader(object):
@@ -109,6 +123,18 @@ class EnexUploader(object):
         self.notebook_root = None
         self.notebook_schema = None  # Store database schema if in DB mode
 
+        # Converts the next note while the current one uploads; one worker
+        # for the whole run, its thread started on first use
+        self._converter = ThreadPoolExecutor(max_workers=1, thread_name_prefix="note-convert")
+
+    def close(self):
+        """Write buffered exception entries and release the converter and progress file handle."""
+        self._converter.shutdown(cancel_futures=True)
+        if self.exception_tracker:
+            self.exception_tracker.flush()
+        if isinstance(self.done_hashes, DoneFile):
+            self.done_hashes.close()
+
     def upload_notebook(self, enex_file: Path, note_title: str | None = None, note_index: int | None = None) -> NotebookStats:
         """Process a single notebook using single-pass parsing.
 
@@ -175,9 +201,23 @@ class EnexUploader(object):
         # Phase 4: Upload successfully parsed notes
         successful_results = [r for r in parse_stats.results if not r.failed and r.note]
 
+        # Convert the next note on a background thread while the current one
+        # uploads, so block conversion overlaps with waiting on the API.
+        # Uploads themselves stay in order: pages appear in notebook order and
+        # the done file / exception trackers are only touched from this thread.
+        next_conversion = self._start_conversion(successful_results[0].note) if successful_results else None
+
         for idx, result in enumerate(successful_results, 1):
             note = result.note
-            upload_result, skip_reason = self._upload_single_note(note, idx, parse_stats.total, notebook_name, result)
+            conversion = next_conversion
+            next_conversion = (
+                self._start_conversion(successful_results[idx].note)
+                if idx < len(successful_results)
+                else None
+            )
+            upload_result, skip_reason = self._upload_single_note(
+                note, idx, parse_stats.total, notebook_name, result, conversion
+            )
 
             if upload_result == "success":
                 notebook_stats.successful += 1
@@ -186,13 +226,40 @@ class EnexUploader(object):
             elif upload_result == "failed":
                 notebook_stats.failed += 1
 
+        # Write this notebook's remaining partial-import entries
+        if self.exception_tracker:
+            self.exception_tracker.flush_partial_imports(notebook_name)
+            self.exception_tracker.reset_notebook_counters(notebook_name)
+
         return notebook_stats
 
+    def _start_conversion(self, note: EvernoteNote):
+        """Start converting a note to Notion blocks ahead of its upload.
+
+        Returns:
+            Future of the (blocks, errors) tuple, or None if the note will be skipped
+        """
+        if note.note_hash in self.done_hashes:
+            return None
+
+        return self._converter.submit(self._convert_note, note)
+
+    def _convert_note(self, note: EvernoteNote):
+        """Add the custom tag and parse the note; returns (blocks, errors)."""
+        # Custom tag must be in place before conversion (it can appear in the meta block)
+        if self.rules.tag and self.rules.tag not in note.tags:
+            note.tags.append(self.rules.tag)
+
+        return self._parse_note(note)
+
     def _upload_single_note(
-        self, note: EvernoteNote, note_idx: int, total_notes: int, notebook_name: str, parse_result
+        self, note: EvernoteNote, note_idx: int, total_notes: int, notebook_name: str, parse_result, conversion=None
     ) -> tuple[str, str | None]:
         """Upload a single note.
 
+        `conversion` is an optional future from _start_conversion(); without
+        it the note is converted here.
+
         Returns:
             Tuple of (status, skip_reason) where status is 'success', 'skipped', or 'failed'
             and skip_reason is a string if skipped, None otherwise
@@ -203,13 +270,9 @@ class EnexUploader(object):
             logger.debug(f"Skipping note '{note.title}' ({skip_reason})")
             return "skipped", skip_reason
 
-        # Add custom tag if specified
-        if self.rules.tag and self.rules.tag not in note.tags:
-            note.tags.append(self.rules.tag)
-
         # Parse note content
         logger.debug(f"Converting note '{note.title}' to Notion blocks")
-        note_blocks, errors = self._parse_note(note)
+        note_blocks, errors = conversion.result() if conversion else self._convert_note(note)
         
         # Handle blank note names
         if not note.title or not note.title.strip():
@@ -226,34 +289,9 @@ class EnexUploader(object):
         try:
             page_id, has_errors, updated_errors, failed_uploads, user_action_blocks = self._upload_note(self.notebook_root, note, note_blocks, errors, notebook_name)
             self.done_hashes.add(note.note_hash)
-            
-            # Track partial import in exception summary page
-            # Filter out user-actionable errors (they go in the User Action Required database instead)
-            if has_errors and self.exception_tracker:
-                # Separate user-actionable errors from informational errors
-                informational_errors = []
-                
-                for error in updated_errors:
-                    # Skip user-actionable errors (they're in the database)
-                    if any(pattern in error for pattern in [
-                        "Invalid URL marked with broken-link icon",
-                        "Invalid bookmark URL",
-                        "Image embed missing source URL",
-                        "File upload failed",
-                        "saved to unsupported-files"
-                    ]):
-                        continue
-                    informational_errors.append(error)
-                
-                # Only track if there are informational errors
-                # User-actionable items are in the database, no need to reference them here
-                if informational_errors:
-                    self.exception_tracker.track_partial_import(
-                        notebook_name=notebook_name,
-                        note_title=note.title,
-                        page_id=page_id,
-                        errors=informational_errors
-                    )
+            if self.exception_tracker:
+                # Just created, so its exception entries needn't re-check it exists
+                self.exception_tracker.remember_live_page(page_id)
             
             # Find the block ID for the first user action marker (for file uploads)
             # We'll use the first marker block ID since file upload failures create markers
@@ -262,13 +300,44 @@ class EnexUploader(object):
                 # Get the first marker block ID (sorted by index)
                 first_marker_block_id = user_action_blocks.get(min(user_action_blocks.keys()))
             
+            # Classify errors in a single pass:
+            # - informational errors go to the notebook's exception summary page
+            # - user-actionable errors go to the User Action Required database
+            informational_errors = []
+            invalid_url_entries = []  # (error_detail, block_id)
+            
+            for error in updated_errors or []:
+                # Check for missing image URL warning
+                if "Image embed missing source URL" in error:
+                    invalid_url_entries.append(("Image embed missing source URL", first_marker_block_id))
+                # Check for invalid URL warnings (broken links)
+                elif "Invalid bookmark URL" in error or "Invalid URL marked with broken-link icon" in error:
+                    # Extract the URL from the error message for better context
+                    # Error format: "Invalid URL marked with broken-link icon: <url>"
+                    url_detail = error.split(":", 1)[1].strip() if ":" in error else error[:150]
+                    # No block-level link available for inline URLs
+                    invalid_url_entries.append((url_detail[:150], None))
+                # File upload failures are tracked from failed_uploads below
+                elif "File upload failed" not in error and "saved to unsupported-files" not in error:
+                    informational_errors.append(error)
+            
+            # Track partial import in exception summary page
+            # Only track if there are informational errors
+            # User-actionable items are in the database, no need to reference them here
+            if has_errors and informational_errors and self.exception_tracker:
+                self.exception_tracker.track_partial_import(
+                    notebook_name=notebook_name,
+                    note_title=note.title,
+                    page_id=page_id,
+                    errors=informational_errors
+                )
+            
             # Add failed file uploads to exceptions database
             if failed_uploads and self.exception_tracker:
-                for idx, failed_file in enumerate(failed_uploads):
-                    # Try to find the corresponding marker block for this file
-                    # For now, use the first marker since we typically have one marker per file
-                    block_id = list(user_action_blocks.values())[idx] if idx < len(user_action_blocks) else first_marker_block_id
-                    self.exception_tracker.add_exception_to_database(
+                for failed_file in failed_uploads.values():
+                    # Link to the file's own placeholder, else the first marker
+                    block_id = failed_file.get("block_id", first_marker_block_id)
+                    self.exception_tracker.queue_exception(
                         notebook_name=notebook_name,
                         note_title=note.title,
                         page_id=page_id,
@@ -278,31 +347,20 @@ class EnexUploader(object):
                     )
             
             # Add other user-actionable warnings to database
-            if updated_errors and self.exception_tracker:
-                for error in updated_errors:
-                    # Check for missing image URL warning
-                    if "Image embed missing source URL" in error:
-                        self.exception_tracker.add_exception_to_database(
-                            notebook_name=notebook_name,
-                            note_title=note.title,
-                            page_id=page_id,
-                            error_type="Invalid URL",
-                            error_detail="Image embed missing source URL",
-                            block_id=first_marker_block_id
-                        )
-                    # Check for invalid URL warnings (broken links)
-                    elif "Invalid bookmark URL" in error or "Invalid URL marked with broken-link icon" in error:
-                        # Extract the URL from the error message for better context
-                        # Error format: "Invalid URL marked with broken-link icon: <url>"
-                        url_detail = error.split(":", 1)[1].strip() if ":" in error else error[:150]
-                        self.exception_tracker.add_exception_to_database(
-                            notebook_name=notebook_name,
-                            note_title=note.title,
-                            page_id=page_id,
-                            error_type="Invalid URL",
-                            error_detail=url_detail[:150],  # Include the actual URL
-                            block_id=None  # No block-level link available for inline URLs
-                        )
+            if self.exception_tracker:
+                for error_detail, block_id in invalid_url_entries:
+                    self.exception_tracker.queue_exception(
+                        notebook_name=notebook_name,
+                        note_title=note.title,
+                        page_id=page_id,
+                        error_type="Invalid URL",
+                        error_detail=error_detail,
+                        block_id=block_id
+                    )
+            
+            # Write all of this note's database entries in one flush
+            if self.exception_tracker:
+                self.exception_tracker.flush_exceptions()
             
             return "success", None
         except NoteUploadFailException as e:
@@ -1,16 +1,43 @@
 """Document Failure Tracker: database for tracking failed document imports."""
 import logging
-from typing import Any
+import threading
+from pathlib import Path
+from typing import Any, Optional
 
+from enex2notion.infrastructure_cache import InfrastructureCache
 from enex2notion.notion_api_wrapper import NotionAPIWrapper
 
 logger = logging.getLogger(__name__)
 
 DOCUMENT_FAILURE_DB_TITLE = "Document import failure"
+FLUSH_BATCH_SIZE = 100  # Queued failures that trigger an automatic flush
+
+# Shared read-only property value for new rows
+_UNRESOLVED = {"checkbox": False}
+
+
+def _text(content: str) -> list[dict[str, Any]]:
+    """Build a single-segment rich_text/title value."""
+    return [{"type": "text", "text": {"content": content}}]
 
 
 class DocumentFailureTracker:
-    def __init__(self, wrapper: NotionAPIWrapper, root_id: str, exceptions_page_id: str = None, recreate: bool = False):
+    """Logs failed document imports as rows of a database under the Exceptions page.
+
+    Rows are queued and written FLUSH_BATCH_SIZE at a time. Nothing writes
+    the last partial batch automatically: callers must call flush() in a
+    finally block when done, or use the tracker as a context manager.
+    Rows still queued when the tracker is discarded are lost.
+    """
+
+    def __init__(
+        self,
+        wrapper: NotionAPIWrapper,
+        root_id: str,
+        exceptions_page_id: str = None,
+        recreate: bool = False,
+        working_dir: Optional[Path] = None,
+    ):
         """Initialize document failure tracker.
         
         Args:
@@ -18,22 +45,48 @@ class DocumentFailureTracker:
             root_id: Root page ID
             exceptions_page_id: Parent page for database (if None, will search for Exceptions page)
             recreate: If True, delete ALL existing databases and create new one
+            working_dir: Directory for cache file (defaults to current directory)
         """
         self.wrapper = wrapper
         self.root_id = root_id
         self.exceptions_page_id = exceptions_page_id
         self.recreate = recreate
         self._db_id: str | None = None
+        self._cache = InfrastructureCache(working_dir or Path.cwd())
+        self._pending: list[dict[str, Any]] = []  # Row properties awaiting flush()
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.flush()
 
     def _find_exceptions_page(self) -> str:
         """Find the Exceptions page under root."""
         if self.exceptions_page_id:
             return self.exceptions_page_id
         
+        # Shared with ExceptionTracker; the page may have been deleted since
+        cached_id = self._cache.get_exceptions_page_id()
+        if cached_id:
+            try:
+                page = self.wrapper.client.pages.retrieve(page_id=cached_id)
+                if page.get("archived") or page.get("in_trash"):
+                    logger.warning("Cached Exceptions page is archived/trashed, searching again")
+                    self._cache.clear_by_id(cached_id)
+                else:
+                    self.exceptions_page_id = cached_id
+                    return self.exceptions_page_id
+            except Exception as e:
+                logger.warning(f"Cached Exceptions page not accessible: {e}")
+                self._cache.clear_by_id(cached_id)
+        
         pages = self.wrapper.search_pages("Exceptions")
         for page in pages:
             if page.get("parent", {}).get("page_id") == self.root_id:
                 self.exceptions_page_id = page["id"]
+                self._cache.set_exceptions_page_id(self.exceptions_page_id)
                 return self.exceptions_page_id
         
         # If not found, return root_id as fallback
@@ -72,6 +125,19 @@ class DocumentFailureTracker:
             
             # Reset recreate flag after deletion to prevent repeated deletions
             self.recreate = False
+            self._cache.clear_database(DOCUMENT_FAILURE_DB_TITLE)
+        
+        # Check cache before searching
+        cached_db_id = self._cache.get_database_id(DOCUMENT_FAILURE_DB_TITLE)
+        if cached_db_id:
+            try:
+                self.wrapper.get_database(cached_db_id)
+                self._db_id = cached_db_id
+                logger.info(f"Using cached document failure database: {self._db_id}")
+                return self._db_id
+            except Exception as e:
+                logger.warning(f"Cached document failure database not accessible: {e}")
+                self._cache.clear_database(DOCUMENT_FAILURE_DB_TITLE)
         
         # Try to find existing database - use FIRST match
         try:
@@ -80,6 +146,7 @@ class DocumentFailureTracker:
                 if m.get("object") == "database" and m.get("parent", {}).get("page_id") == exceptions_page_id:
                     self._db_id = m["id"]
                     logger.info(f"Found existing document failure database: {self._db_id}")
+                    self._cache.set_database_id(DOCUMENT_FAILURE_DB_TITLE, self._db_id)
                     return self._db_id
         except Exception as e:
             logger.warning(f"Failed to search for existing database: {e}")
@@ -97,6 +164,7 @@ class DocumentFailureTracker:
         db = self.wrapper.create_database(exceptions_page_id, DOCUMENT_FAILURE_DB_TITLE, schema)
         self._db_id = db["id"]
         logger.info(f"Created new document failure database: {self._db_id}")
+        self._cache.set_database_id(DOCUMENT_FAILURE_DB_TITLE, self._db_id)
         return self._db_id
 
     def log_document_failure(self,
@@ -105,7 +173,11 @@ class DocumentFailureTracker:
                             import_source: str,
                             source_page_title: str,
                             download_location: str):
-        """Log a failed document import to the database.
+        """Queue a failed document import for the database.
+        
+        Rows are written by flush(), which runs automatically every
+        FLUSH_BATCH_SIZE failures. Callers must flush() the remainder
+        when done, or use the tracker as a context manager.
         
         Args:
             filename: The name of the file with extension (e.g., "document.exe")
@@ -114,18 +186,39 @@ class DocumentFailureTracker:
             source_page_title: Source page title where file was referenced
             download_location: Download directory on disk where file was saved
         """
-        db_id = self.ensure_db()
-        
         props = {
-            "Title": {"title": [{"type": "text", "text": {"content": filename}}]},
+            "Title": {"title": _text(filename)},
             "FileLocation": {"url": file_location_url},
-            "ImportSource": {"rich_text": [{"type": "text", "text": {"content": import_source}}]},
-            "Source-Page": {"rich_text": [{"type": "text", "text": {"content": source_page_title}}]},
-            "FileDownloadLocation": {"rich_text": [{"type": "text", "text": {"content": download_location}}]},
-            "Resolved": {"checkbox": False},
+            "ImportSource": {"rich_text": _text(import_source)},
+            "Source-Page": {"rich_text": _text(source_page_title)},
+            "FileDownloadLocation": {"rich_text": _text(download_location)},
+            "Resolved": _UNRESOLVED,
         }
-        try:
-            self.wrapper.create_page(parent_id=db_id, title="", properties=props)
-            logger.debug(f"Logged document failure: {filename}")
-        except Exception as e:
-            logger.warning(f"Failed to log document failure for {filename}: {e}")
+        with self._lock:
+            self._pending.append(props)
+            should_flush = len(self._pending) >= FLUSH_BATCH_SIZE
+        
+        if should_flush:
+            self.flush()
+
+    def flush(self):
+        """Write all queued document failures to the database.
+        
+        Rows are created one at a time; the wrapper paces the requests.
+        """
+        with self._lock:
+            pending = self._pending
+            self._pending = []
+        
+        if not pending:
+            return
+        
+        db_id = self.ensure_db()
+        
+        for props in pending:
+            filename = props["Title"]["title"][0]["text"]["content"]
+            try:
+                self.wrapper.create_page(parent_id=db_id, title="", properties=props)
+                logger.debug(f"Logged document failure: {filename}")
+            except Exception as e:
+                logger.warning(f"Failed to log document failure for {filename}: {e}")
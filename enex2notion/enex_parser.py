@@ -173,7 +173,7 @@ def parse_all_notes(enex_file: Path, note_title_filter: str | None = None, note_
         note_title_filter: If provided, only parse notes with exact matching title
         note_index_filter: If provided, only parse note at this 1-based index
 
-    Returns ParseStats with all results including raw XML for failed notes.
+    Returns ParseStats with all results; raw XML is kept for failed notes only.
     This eliminates the need for separate count_notes() and iter_notes() calls.
     """
     stats = ParseStats()
@@ -196,8 +196,10 @@ def parse_all_notes(enex_file: Path, note_title_filter: str | None = None, note_
             # Only count and add if it passed all filters
             stats.total += 1
             
+            # Raw XML is only needed to export failed notes; dropping it here keeps
+            # a large ENEX from holding every note's XML until upload finishes
             result = NoteParseResult(
-                note=note, raw_xml=raw_xml, error=None, parse_success=True
+                note=note, raw_xml=None, error=None, parse_success=True
             )
             stats.successful += 1
             stats.results.append(result)
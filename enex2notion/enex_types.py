@@ -3,7 +3,7 @@ from dataclasses import dataclass, field
 from datetime import datetime
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EvernoteResource(object):
     data_bin: bytes
     size: int
@@ -13,7 +13,7 @@ class EvernoteResource(object):
     source_url: str = ""  # Source URL from resource-attributes
 
 
-@dataclass
+@dataclass(slots=True)
 class EvernoteNote(object):
     title: str
     created: datetime
@@ -26,40 +26,45 @@ class EvernoteNote(object):
     is_email: bool
     resources: list[EvernoteResource]
     _note_hash: str = None
+    _resources_by_md5: dict[str, EvernoteResource] | None = field(default=None, init=False, repr=False, compare=False)
 
     def resource_by_md5(self, md5):
-        for resource in self.resources:
-            if resource.md5 == md5:
-                return resource
-        return None
+        if self._resources_by_md5 is None:
+            # Built once; first resource wins for duplicate hashes, as with a linear scan
+            by_md5 = {}
+            for resource in self.resources:
+                by_md5.setdefault(resource.md5, resource)
+            self._resources_by_md5 = by_md5  # noqa: WPS601
+
+        return self._resources_by_md5.get(md5)
 
     @property
     def note_hash(self):
+        # The digest is persisted in the done file, so the algorithm is part of
+        # the resume format: switching it would re-upload every finished note
         if self._note_hash is None:
-            hashable = [
-                self.title,
-                self.created.isoformat(),
-                self.updated.isoformat(),
-                self.content,
-                "".join(self.tags),
-                self.author,
-                self.url,
-            ]
-
-            s1_hash = hashlib.sha1()
-            for h in hashable:
-                s1_hash.update(h.encode("utf-8"))
+            # Stream fields straight into the digest; feeding tags one by one
+            # hashes the same bytes as "".join(tags) without the joined copy
+            s1_hash = hashlib.sha1(usedforsecurity=False)
+            s1_hash.update(self.title.encode("utf-8"))
+            s1_hash.update(self.created.isoformat().encode("utf-8"))
+            s1_hash.update(self.updated.isoformat().encode("utf-8"))
+            s1_hash.update(self.content.encode("utf-8"))
+            for tag in self.tags:
+                s1_hash.update(tag.encode("utf-8"))
+            s1_hash.update(self.author.encode("utf-8"))
+            s1_hash.update(self.url.encode("utf-8"))
             self._note_hash = s1_hash.hexdigest()  # noqa: WPS601
 
         return self._note_hash
 
 
-@dataclass
+@dataclass(slots=True)
 class NoteParseResult:
     """Result of parsing a single note from ENEX."""
 
     note: EvernoteNote | None
-    raw_xml: str  # Original XML element as string for failed export
+    raw_xml: str | None  # Original XML element as string for failed export (None for parsed notes)
     error: Exception | None
     parse_success: bool
     skip_reason: str | None = None  # Reason for skipping (if applicable)
@@ -69,7 +74,7 @@ class NoteParseResult:
         return not self.parse_success or self.note is None
 
 
-@dataclass
+@dataclass(slots=True)
 class ParseStats:
     """Statistics from parsing an ENEX file."""
 
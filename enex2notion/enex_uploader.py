@@ -1,4 +1,7 @@
+import atexit
 import logging
+import re
+import threading
 import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
@@ -7,15 +10,62 @@ from tqdm import tqdm
 from enex2notion.enex_types import EvernoteNote
 from enex2notion.image_handler import upload_image_to_notion
 from enex2notion.notion_block_converter import convert_block_to_api_format
-from enex2notion.notion_api_wrapper import note_to_database_properties
+from enex2notion.notion_api_wrapper import note_to_database_properties, partial_import_properties, retry_after_seconds
 from enex2notion.notion_blocks.uploadable import NotionImageBlock, NotionPDFBlock, NotionFileBlock
-from enex2notion.parse_warnings import init_warnings, get_warnings, clear_warnings
+from enex2notion.parse_warnings import init_warnings, get_warnings, clear_warnings, warnings_scope
 from enex2notion.partial_import_handler import create_error_summary_block, create_source_bookmark
 from enex2notion.utils_exceptions import NoteUploadFailException
 
 logger = logging.getLogger(__name__)
 
 PROGRESS_BAR_WIDTH = 80
+APPEND_BATCH_SIZE = 100  # Notion's limit on children per append request
+
+# Known upload failures: (lowercase phrases to look for in the error, help lines to log)
+# The first entry with a matching phrase wins
+UPLOAD_FAILURE_HELP = (
+    (
+        ("is not a property that exists",),
+        (
+            "",
+            "✗ DATABASE SCHEMA MISMATCH",
+            "  The database exists but has the wrong properties.",
+            "",
+            "SOLUTION: Delete the existing database and retry",
+            "  1. Open Notion",
+            "  2. Find and delete the database under 'Evernote ENEX Import'",
+            "  3. Run this command again",
+            "",
+        ),
+    ),
+    (
+        ("could not find", "make sure the relevant"),
+        (
+            "",
+            "✗ DATABASE ACCESS ERROR",
+            "  The database was created but the Integration doesn't have access.",
+            "",
+            "SOLUTION: The database should inherit permissions from the root page.",
+            "  If this persists:",
+            "  1. Open the database in Notion",
+            "  2. Click '...' → 'Add connections'",
+            "  3. Select your Integration",
+            "  4. Or delete the database and let it be recreated",
+            "",
+        ),
+    ),
+)
+
+# Errors worth retrying an append batch for (timeouts, dropped connections, 429/5xx)
+TRANSIENT_ERROR_RE = re.compile(r"timeout|connection|rate[ _-]?limit|\b(?:429|500|502|503|504)\b", re.IGNORECASE)
+
+UPLOADABLE_BLOCK_TYPES = (NotionImageBlock, NotionPDFBlock, NotionFileBlock)
+
+# Concurrent file uploads, in one pool shared across notes so parallel uploads stay within budget.
+# This only bounds overlap - the request rate is enforced by the wrapper's token bucket
+NOTION_UPLOAD_CONCURRENCY = 8
+_upload_pool = None
+_upload_pool_lock = threading.Lock()
 
 
 def upload_note(wrapper, root_id, note: EvernoteNote, note_blocks, errors, is_database=False, database_schema=None, rejected_tracker=None, notebook_name="", unsupported_dir=None):
@@ -34,57 +84,62 @@ def upload_note(wrapper, root_id, note: EvernoteNote, note_blocks, errors, is_da
         unsupported_dir: Directory to save unsupported files (optional)
     
     Returns:
-        Tuple of (page_id, had_errors, errors) where:
+        Tuple of (page_id, had_errors, errors, failed_uploads, user_action_blocks) where:
         - page_id: Notion page ID
         - had_errors: True if partial import
         - errors: Updated list of all errors/warnings
+        - failed_uploads: Resource md5 -> {"filename", "path"} for each file
+          saved to disk instead, plus "block_id" of its placeholder when known
+        - user_action_blocks: Index -> block ID of top-level user action markers
     """
     try:
         return _upload_note(wrapper, root_id, note, note_blocks, errors, is_database, database_schema, rejected_tracker, notebook_name, unsupported_dir)
     except Exception as e:
         error_msg = str(e).lower()
-        if "is not a property that exists" in error_msg:
-            logger.error("")
-            logger.error("✗ DATABASE SCHEMA MISMATCH")
-            logger.error("  The database exists but has the wrong properties.")
-            logger.error("")
-            logger.error("SOLUTION: Delete the existing database and retry")
-            logger.error("  1. Open Notion")
-            logger.error("  2. Find and delete the database under 'Evernote ENEX Import'")
-            logger.error("  3. Run this command again")
-            logger.error("")
-        elif "could not find" in error_msg or "make sure the relevant" in error_msg:
-            logger.error("")
-            logger.error("✗ DATABASE ACCESS ERROR")
-            logger.error("  The database was created but the Integration doesn't have access.")
-            logger.error("")
-            logger.error("SOLUTION: The database should inherit permissions from the root page.")
-            logger.error("  If this persists:")
-            logger.error("  1. Open the database in Notion")
-            logger.error("  2. Click '...' → 'Add connections'")
-            logger.error("  3. Select your Integration")
-            logger.error("  4. Or delete the database and let it be recreated")
-            logger.error("")
+        for phrases, help_lines in UPLOAD_FAILURE_HELP:
+            if any(phrase in error_msg for phrase in phrases):
+                for line in help_lines:
+                    logger.error(line)
+                break
         raise NoteUploadFailException from e
 
 
+def _get_upload_pool():
+    """Return the shared file upload pool, starting it on first use.
+    
+    One long-lived pool avoids spawning worker threads for every note.
+    """
+    global _upload_pool
+    with _upload_pool_lock:
+        if _upload_pool is None:
+            _upload_pool = ThreadPoolExecutor(max_workers=NOTION_UPLOAD_CONCURRENCY, thread_name_prefix="notion-upload")
+            atexit.register(_upload_pool.shutdown)
+        return _upload_pool
+
+
 def _collect_uploadable_blocks(blocks, uploadable_list):
-    """Recursively collect all uploadable blocks (images, PDFs, files).
+    """Collect all uploadable blocks (images, PDFs, files) in document order.
+    
+    Walks the tree with an explicit stack so deeply nested notes can't hit
+    the recursion limit.
     
     Args:
         blocks: List of blocks to scan
         uploadable_list: Output list to append uploadable blocks to
     """
-    for block in blocks:
-        if isinstance(block, (NotionImageBlock, NotionPDFBlock, NotionFileBlock)):
+    stack = list(reversed(blocks))
+    while stack:
+        block = stack.pop()
+        if isinstance(block, UPLOADABLE_BLOCK_TYPES):
             uploadable_list.append(block)
         
-        # Process children recursively
-        if hasattr(block, "children") and block.children:
-            _collect_uploadable_blocks(block.children, uploadable_list)
+        # Visit children next, first child on top
+        # (NotionBaseBlock always sets children, so no attribute probe is needed)
+        if block.children:
+            stack.extend(reversed(block.children))
 
 
-def _upload_single_file(block, notion_api, rejected_tracker, notebook_name, note_title, unsupported_dir, failed_uploads_list):
+def _upload_single_file(block, notion_api, rejected_tracker, notebook_name, note_title, unsupported_dir):
     """Upload a single file block to Notion.
     
     Args:
@@ -94,35 +149,29 @@ def _upload_single_file(block, notion_api, rejected_tracker, notebook_name, note
         notebook_name: Name of notebook for tracking
         note_title: Title of note for tracking
         unsupported_dir: Directory to save unsupported files (optional)
-        failed_uploads_list: List to collect failed upload info
         
     Returns:
-        Tuple of (block, upload_id, warnings) where upload_id is None if failed,
-        and warnings is a list of warning messages from this upload
+        Tuple of (block, upload_id, warnings, saved_file) where upload_id is
+        None if failed, warnings is a list of warning messages from this
+        upload, and saved_file is the {"filename", "path"} info of a failed
+        upload saved to disk (None otherwise)
     """
-    # Initialize warnings for this thread
-    from enex2notion.parse_warnings import init_warnings, get_warnings, clear_warnings
-    clear_warnings()
-    init_warnings()
-    
-    upload_id = upload_image_to_notion(
-        block.resource, notion_api, rejected_tracker, notebook_name, note_title, unsupported_dir, failed_uploads_list
-    )
+    saved_files = []
+    # Collect this upload's warnings separately from the worker thread's
+    with warnings_scope() as warnings:
+        upload_id = upload_image_to_notion(
+            block.resource, notion_api, rejected_tracker, notebook_name, note_title, unsupported_dir, saved_files
+        )
     
-    # Collect warnings from this thread
-    warnings = get_warnings()
-    
-    return (block, upload_id, warnings)
+    return (block, upload_id, warnings, saved_files[0] if saved_files else None)
 
 
-def _process_image_blocks(blocks, notion_api, rejected_tracker=None, notebook_name="", note_title="", unsupported_dir=None, failed_uploads_list=None):
-    """Process uploadable blocks: upload to Notion concurrently and set file_upload IDs.
+def _submit_uploads(blocks, notion_api, rejected_tracker, notebook_name, note_title, unsupported_dir):
+    """Start uploading all uploadable blocks (images, PDFs, files) without waiting.
     
-    Handles images, PDFs, and generic files with concurrent uploads (max 3 workers
-    to respect Notion's ~3 req/s rate limit).
-    
-    Returns:
-        List of warnings collected from all file uploads
+    Handles images, PDFs, and generic files with concurrent uploads
+    (NOTION_UPLOAD_CONCURRENCY workers; 429s are backed off in upload_image_to_notion).
+    Pair with _collect_uploads() to wait for results and set file_upload IDs.
     
     Args:
         blocks: List of blocks to process
@@ -131,73 +180,107 @@ def _process_image_blocks(blocks, notion_api, rejected_tracker=None, notebook_na
         notebook_name: Name of notebook for tracking rejected files
         note_title: Title of note for tracking rejected files
         unsupported_dir: Directory to save unsupported files (optional)
-        failed_uploads_list: List to collect failed upload info (filename, path)
-    """
-    from enex2notion.parse_warnings import add_warning
     
+    Returns:
+        Dict mapping each upload future to the blocks that share its file
+    """
     # Collect all uploadable blocks
     uploadable_blocks = []
     _collect_uploadable_blocks(blocks, uploadable_blocks)
     
     if not uploadable_blocks:
-        return []
+        # Text-only note - don't touch (or start) the upload pool
+        return {}
+    
+    # Notes often embed the same resource several times (e.g. a logo);
+    # upload each file once and attach the ID to every block using it
+    blocks_by_md5 = {}
+    for block in uploadable_blocks:
+        blocks_by_md5.setdefault(block.resource.md5, []).append(block)
     
-    # Upload files concurrently with thread pool (max 3 workers for rate limiting)
-    logger.debug(f"Uploading {len(uploadable_blocks)} files concurrently...")
+    logger.debug(f"Uploading {len(blocks_by_md5)} files concurrently...")
     
+    upload_pool = _get_upload_pool()
+    return {
+        upload_pool.submit(
+            _upload_single_file, same_file[0], notion_api, rejected_tracker, notebook_name, note_title, unsupported_dir
+        ): same_file
+        for same_file in blocks_by_md5.values()
+    }
+
+
+def _collect_uploads(future_to_blocks, failed_uploads):
+    """Wait for submitted uploads and set file_upload IDs on their blocks.
+    
+    Args:
+        future_to_blocks: Dict returned by _submit_uploads()
+        failed_uploads: Output dict; failed uploads saved to disk are added
+            as resource md5 -> {"filename", "path"}
+    
+    Returns:
+        List of warnings collected from all file uploads
+    """
     all_warnings = []
     
-    with ThreadPoolExecutor(max_workers=3) as executor:
-        # Submit all upload tasks
-        future_to_block = {
-            executor.submit(
-                _upload_single_file, block, notion_api, rejected_tracker, notebook_name, note_title, unsupported_dir, failed_uploads_list
-            ): block
-            for block in uploadable_blocks
-        }
-        
-        # Collect results as they complete
-        for future in as_completed(future_to_block):
-            try:
-                block, upload_id, warnings = future.result()
-                
-                # Collect warnings from worker thread
-                if warnings:
-                    all_warnings.extend(warnings)
-                    # Also add to main thread's warning context
-                    for warning in warnings:
-                        add_warning(warning)
-                
-                if upload_id:
-                    block.attrs["file_upload_id"] = upload_id
-                    block_type = block.__class__.__name__
-                    logger.debug(f"Uploaded {block_type}, file_upload ID: {upload_id}")
+    # Collect results as they complete
+    for future in as_completed(future_to_blocks):
+        try:
+            block, upload_id, warnings, saved_file = future.result()
+            
+            # Collect warnings from worker thread
+            # (returned rather than added to the note's warning context, which
+            # _upload_note merges separately - adding them there too listed them twice)
+            all_warnings.extend(warnings)
+            
+            if upload_id:
+                for same_file_block in future_to_blocks[future]:
+                    same_file_block.attrs["file_upload_id"] = upload_id
+                block_type = block.__class__.__name__
+                logger.debug(f"Uploaded {block_type}, file_upload ID: {upload_id}")
+            else:
+                # Mark blocks as failed so we can add placeholders
+                for same_file_block in future_to_blocks[future]:
+                    same_file_block.attrs["upload_failed"] = True
+                block_type = block.__class__.__name__
+                if saved_file:
+                    # Keyed by md5, so blocks sharing the file get a single entry
+                    # (uploadable blocks always carry their resolved resource)
+                    failed_uploads[block.resource.md5] = saved_file
+                    logger.debug(f"{block_type} saved to disk: {saved_file['path']}")
                 else:
-                    # Mark block as failed so we can add a placeholder
-                    block.attrs["upload_failed"] = True
-                    block_type = block.__class__.__name__
-                    # Check if this file was saved to disk (appears in failed_uploads_list)
-                    # If file is in failed_uploads_list, it was successfully saved to disk
-                    was_saved_to_disk = False
-                    if failed_uploads_list and hasattr(block, 'resource') and block.resource:
-                        # Check if this resource's file appears in failed_uploads by filename
-                        resource_filename = getattr(block.resource, 'file_name', None)
-                        if resource_filename:
-                            for failed_file in failed_uploads_list:
-                                if failed_file.get('filename') == resource_filename:
-                                    was_saved_to_disk = True
-                                    logger.debug(f"{block_type} saved to disk: {failed_file.get('path')}")
-                                    break
-                    
-                    if not was_saved_to_disk:
-                        # Actual upload failure - this is unexpected
-                        logger.warning(f"Failed to upload {block_type}")
-            except Exception as e:
-                logger.error(f"File upload failed with exception: {e}")
+                    # Actual upload failure - this is unexpected
+                    logger.warning(f"Failed to upload {block_type}")
+        except Exception as e:
+            logger.error(f"File upload failed with exception: {e}")
     
     return all_warnings
 
 
+def _convert_blocks_to_api(blocks, failed_upload_markers):
+    """Convert blocks to API format.
+    
+    Args:
+        blocks: List of blocks to convert
+        failed_upload_markers: Output dict; the placeholder of each top-level
+            block whose upload failed is added as id(api_block) -> resource md5
+    
+    Returns:
+        List of API blocks, with split tables flattened in place
+    """
+    api_blocks = []
+    for block in blocks:
+        converted = convert_block_to_api_format(block)
+        if converted:
+            # Tables may return a list if they were split
+            if isinstance(converted, list):
+                api_blocks.extend(converted)
+            else:
+                if block.attrs.get("upload_failed"):
+                    failed_upload_markers[id(converted)] = block.resource.md5
+                api_blocks.append(converted)
+    return api_blocks
+
+
 def _upload_note(wrapper, root_id, note: EvernoteNote, note_blocks, errors, is_database, database_schema, rejected_tracker, notebook_name, unsupported_dir=None):
     """Internal: Upload note with partial import support.
     
@@ -226,33 +309,57 @@ def _upload_note(wrapper, root_id, note: EvernoteNote, note_blocks, errors, is_d
     has_errors = bool(errors)
     
     # Prepend error summary and source bookmark if there are errors
+    # Set when the summary callout is the first block, so it can be replaced
+    # later without mistaking a callout from the note itself for it
+    error_block_prepended = False
+    prepended_error_count = 0  # Errors listed in the prepended summary
     if has_errors:
+        header_blocks = []
+        
         # Create error summary block
         error_block = create_error_summary_block(errors)
         if error_block:
-            note_blocks.insert(0, error_block)
+            header_blocks.append(error_block)
+            error_block_prepended = True
+            prepended_error_count = len(errors)
         
-        # Add source bookmark if webclip with URL
+        # Add source bookmark (after error summary) if webclip with URL
         if note.url:
             bookmark_block = create_source_bookmark(note.url)
             if bookmark_block:
-                # Insert after error summary
-                insert_pos = 1 if error_block else 0
-                note_blocks.insert(insert_pos, bookmark_block)
+                header_blocks.append(bookmark_block)
+        
+        # Splice in one go rather than shifting the whole note per insert
+        note_blocks[:0] = header_blocks
 
+    # Process uploadable blocks (images, PDFs, files): upload to Notion and set file_upload IDs
+    # Uploads start first so they overlap with page creation
+    failed_uploads = {}  # Resource md5 -> failed upload saved to disk, for database entries
+    # Uploadable blocks whose resource didn't resolve are dropped at parse time,
+    # so a note without resources has nothing to upload - skip the tree walk
+    upload_futures = _submit_uploads(
+        note_blocks, wrapper, rejected_tracker, notebook_name, note.title, unsupported_dir
+    ) if note.resources else {}
+    
     # Create page
-    if is_database:
-        properties = note_to_database_properties(note, database_schema, partial_import=has_errors)
-        logger.debug(f"  Generated properties: {properties}")
-        new_page = wrapper.create_page(parent_id=root_id, title=note.title, properties=properties)
-    else:
-        new_page = wrapper.create_page(parent_id=root_id, title=note.title)
+    # Whether the page is created with its Partial Import flag already set
+    marked_partial = is_database and has_errors
+    try:
+        if is_database:
+            properties = note_to_database_properties(note, database_schema, partial_import=has_errors)
+            logger.debug(f"  Generated properties: {properties}")
+            new_page = wrapper.create_page(parent_id=root_id, title=note.title, properties=properties)
+        else:
+            new_page = wrapper.create_page(parent_id=root_id, title=note.title)
+    except Exception:
+        # No page to attach files to - drop uploads that haven't started
+        for future in upload_futures:
+            future.cancel()
+        raise
+    
+    file_upload_warnings = _collect_uploads(upload_futures, failed_uploads)
 
     page_id = new_page["id"]
-
-    # Process uploadable blocks (images, PDFs, files): upload to Notion and set file_upload IDs
-    failed_uploads = []  # Track failed uploads for database entry
-    file_upload_warnings = _process_image_blocks(note_blocks, wrapper, rejected_tracker, notebook_name, note.title, unsupported_dir, failed_uploads)
     
     # Merge file upload warnings with errors
     if file_upload_warnings:
@@ -260,16 +367,10 @@ def _upload_note(wrapper, root_id, note: EvernoteNote, note_blocks, errors, is_d
         errors.extend(file_upload_warnings)
         has_errors = True
 
-    # Convert blocks to API format
-    api_blocks = []
-    for block in note_blocks:
-        converted = convert_block_to_api_format(block)
-        if converted:
-            # Tables may return a list if they were split
-            if isinstance(converted, list):
-                api_blocks.extend(converted)
-            else:
-                api_blocks.append(converted)
+    # Convert blocks to API format (all of them before the first append, so
+    # the error summary at the top of the page includes every warning)
+    failed_upload_markers = {}
+    api_blocks = _convert_blocks_to_api(note_blocks, failed_upload_markers)
     
     # Collect any warnings from conversion phase
     conversion_warnings = get_warnings()
@@ -280,35 +381,33 @@ def _upload_note(wrapper, root_id, note: EvernoteNote, note_blocks, errors, is_d
         # Update has_errors flag
         has_errors = bool(errors)
         
-    # Update page properties and error summary if we have any errors
-    if has_errors:
-        # Update database properties to set partial import flag
-        if is_database:
-            logger.debug("  Updating page to mark as partial import")
-            try:
-                properties = note_to_database_properties(note, database_schema, partial_import=True)
-                wrapper.client.pages.update(page_id=page_id, properties=properties)
-            except Exception as e:
-                logger.warning(f"Failed to update partial import flag: {e}")
-        
-        # Remove old error block if it exists
-        if api_blocks and api_blocks[0].get("type") == "callout":
-            api_blocks.pop(0)
-        
-        # Create updated error block with all errors
+    # Update the error summary if errors were added since it was prepended
+    # (the Partial Import flag is set once, after the blocks are appended)
+    summary_is_current = error_block_prepended and len(errors) == prepended_error_count
+    if has_errors and not summary_is_current:
+        # Create updated error block with all errors, replacing the old one in place
         error_block = create_error_summary_block(errors)
         if error_block:
             error_block_api = convert_block_to_api_format(error_block)
-            if error_block_api:
+            if error_block_prepended:
+                api_blocks[0] = error_block_api
+            else:
                 api_blocks.insert(0, error_block_api)
 
     # Upload blocks in batches and track user action marker block IDs
+    batch_count = -(-len(api_blocks) // APPEND_BATCH_SIZE)
+    # No bar for single-batch notes (most of them), and disable=None turns it
+    # off when stderr isn't a TTY so redirected logs don't fill with redraws
     progress_iter = tqdm(
-        iterable=range(0, len(api_blocks), 100),
-        total=(len(api_blocks) + 99) // 100,
+        iterable=(
+            api_blocks[start_idx : start_idx + APPEND_BATCH_SIZE]
+            for start_idx in range(0, len(api_blocks), APPEND_BATCH_SIZE)
+        ),
+        total=batch_count,
         unit="batch",
         leave=False,
         ncols=PROGRESS_BAR_WIDTH,
+        disable=True if batch_count <= 1 else None,
     )
 
     block_upload_error = None
@@ -316,9 +415,7 @@ def _upload_note(wrapper, root_id, note: EvernoteNote, note_blocks, errors, is_d
     uploaded_blocks = []  # Store all uploaded block objects with IDs
     
     try:
-        for start_idx in progress_iter:
-            batch = api_blocks[start_idx : start_idx + 100]
-            
+        for batch in progress_iter:
             # Retry logic for this batch
             for attempt in range(max_retries):
                 try:
@@ -329,13 +426,13 @@ def _upload_note(wrapper, root_id, note: EvernoteNote, note_blocks, errors, is_d
                     is_last_attempt = (attempt == max_retries - 1)
                     
                     # Check if it's a transient error worth retrying
-                    error_msg = str(batch_error).lower()
-                    is_transient = any(x in error_msg for x in [
-                        "timeout", "connection", "rate limit", "429", "503", "502", "500"
-                    ])
+                    is_transient = TRANSIENT_ERROR_RE.search(str(batch_error)) is not None
                     
                     if is_transient and not is_last_attempt:
-                        wait_time = (2 ** attempt) * 0.5  # 0.5s, 1s, 2s
+                        # Server-advised wait for 429s, else 0.5s, 1s, 2s
+                        wait_time = retry_after_seconds(batch_error)
+                        if wait_time is None:
+                            wait_time = (2 ** attempt) * 0.5
                         logger.warning(
                             f"Transient error uploading block batch (attempt {attempt + 1}/{max_retries}): {batch_error}"
                         )
@@ -353,15 +450,17 @@ def _upload_note(wrapper, root_id, note: EvernoteNote, note_blocks, errors, is_d
         errors = list(errors) if errors else []
         errors.append(f"Failed to upload blocks: {block_upload_error}")
         has_errors = True
-        
-        # Update page to mark as partial import
-        if is_database:
+
+    # One update covers upload, conversion and block failures found after the
+    # page was created (pages created with errors already carry the flag)
+    if is_database and has_errors and not marked_partial:
+        logger.debug("  Updating page to mark as partial import")
+        properties = partial_import_properties(database_schema)
+        if properties:
             try:
-                properties = note_to_database_properties(note, database_schema, partial_import=True)
                 wrapper.client.pages.update(page_id=page_id, properties=properties)
-                logger.debug("  Marked page as partial import due to block upload failure")
-            except Exception as update_err:
-                logger.warning(f"Failed to update partial import flag: {update_err}")
+            except Exception as e:
+                logger.warning(f"Failed to update partial import flag: {e}")
 
     if block_upload_error:
         logger.warning(f"Note '{note.title}' uploaded with errors (page created but some blocks failed)")
@@ -371,7 +470,7 @@ def _upload_note(wrapper, root_id, note: EvernoteNote, note_blocks, errors, is_d
     # Map user action marker blocks to their block IDs
     # This allows us to create direct block links in the exception database
     user_action_blocks = {}  # Maps block index to block ID
-    for idx, uploaded_block in enumerate(uploaded_blocks):
+    for idx, (api_block, uploaded_block) in enumerate(zip(api_blocks, uploaded_blocks)):
         # Check if this is a user action marker (callout with wrench emoji)
         block_type = uploaded_block.get("type")
         if block_type == "callout":
@@ -380,5 +479,9 @@ def _upload_note(wrapper, root_id, note: EvernoteNote, note_blocks, errors, is_d
             # Check for wrench emoji in icon
             if icon.get("type") == "emoji" and icon.get("emoji") == "🔧":
                 user_action_blocks[idx] = uploaded_block["id"]
+                # Link the failed file's entry to its first placeholder
+                md5 = failed_upload_markers.get(id(api_block))
+                if md5 in failed_uploads:
+                    failed_uploads[md5].setdefault("block_id", uploaded_block["id"])
     
     return (page_id, has_errors, errors, failed_uploads, user_action_blocks)
@@ -1,4 +1,5 @@
 import logging
+import time
 
 from enex2notion.notion_api_wrapper import create_notebook_database_schema
 from enex2notion.utils_exceptions import NoteUploadFailException
@@ -28,13 +29,20 @@ def _get_notebook_page(wrapper, root_page_id, title):
     # Search for existing page
     pages = wrapper.search_pages(title)
     
-    # Filter out archived/deleted items
-    active_pages = [p for p in pages if not p.get("archived", False) and not p.get("in_trash", False)]
-
-    for page in active_pages:
-        if page.get("parent", {}).get("page_id") == root_page_id:
-            logger.info(f"Found existing notebook page: {title}")
-            return page["id"]
+    # First non-archived/deleted page under the root
+    page = next(
+        (
+            p
+            for p in pages
+            if not p.get("archived", False)
+            and not p.get("in_trash", False)
+            and p.get("parent", {}).get("page_id") == root_page_id
+        ),
+        None,
+    )
+    if page:
+        logger.info(f"Found existing notebook page: {title}")
+        return page["id"]
 
     # Create new page
     logger.info(f"Creating new notebook page: {title}")
@@ -108,10 +116,8 @@ def _get_notebook_database(wrapper, root_page_id, title):
         logger.info("        3. Select your Integration")
         logger.info("")
         
-        # Longer delay to ensure database is fully propagated
-        import time
-        logger.info("  Waiting 3 seconds for Notion to propagate permissions...")
-        time.sleep(3)
+        # Confirm the database is reachable rather than sleeping a fixed delay
+        _wait_for_database(wrapper, database_id)
         
         return database_id, schema
     except Exception as e:
@@ -132,3 +138,23 @@ def _get_notebook_database(wrapper, root_page_id, title):
             logger.error(f"  Details: {e}")
             logger.error("")
         raise
+
+
+def _wait_for_database(wrapper, database_id, retry_delays=(0.5, 1, 2)):
+    """Wait until a newly created database can be retrieved.
+
+    Notion sometimes answers 'not found' for a moment after creation while
+    permissions propagate; this only waits when that actually happens.
+    Gives up quietly after the last retry and lets the upload report it.
+    """
+    for delay in (*retry_delays, None):
+        try:
+            wrapper.get_database(database_id)
+            return
+        except Exception as e:
+            error_msg = str(e).lower()
+            if delay is None or not ("object not found" in error_msg or "could not find" in error_msg):
+                logger.debug(f"  New database not verified: {e}")
+                return
+            logger.debug(f"  Database not visible yet, retrying in {delay}s...")
+            time.sleep(delay)
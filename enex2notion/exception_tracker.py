@@ -5,13 +5,108 @@ Manages the "Exceptions" summary page structure with real-time updates:
 """
 import logging
 import time
+from collections import Counter
+from itertools import islice
 from pathlib import Path
 from typing import Any, Optional
 
 from enex2notion.infrastructure_cache import InfrastructureCache
+from enex2notion.notion_api_wrapper import retry_on_transient_errors
 
 logger = logging.getLogger(__name__)
 
+# Partial-import entries per append; each carries up to 11 nested bullets and
+# Notion caps a request at 1000 blocks in total
+PARTIAL_IMPORT_BATCH_SIZE = 50
+
+# Same limits for link-failure toggles, which carry up to 10 nested bullets
+SPECIAL_ENTRY_BATCH_SIZE = 50
+
+# Notion caps a request at 100 top-level blocks and 1000 blocks in total
+MAX_APPEND_CHILDREN = 100
+MAX_APPEND_TOTAL_BLOCKS = 1000
+
+# Seconds a search result is reused; infrastructure setup runs per notebook
+# and repeats the same title searches
+SEARCH_CACHE_TTL = 60
+
+# Failed writes logged at full level per category before the rest go to DEBUG
+FAILURE_LOG_LIMIT = 5
+
+# Title slugs for the User Action Required error types
+ERROR_TYPE_SLUGS = {
+    "File Upload Failed": "FileUploadFailed",
+    "Invalid URL": "InvalidURL",
+    "Table Split": "TableSplit",
+}
+
+# Intro blocks written when the Exceptions and notebook exception pages are created
+EXCEPTIONS_INTRO_BLOCKS = [
+    {
+        "object": "block",
+        "type": "paragraph",
+        "paragraph": {
+            "rich_text": [
+                {
+                    "type": "text",
+                    "text": {
+                        "content": "This page lists all partially imported notes with errors. "
+                        "Each notebook has a child page listing its exceptions."
+                    },
+                }
+            ]
+        },
+    }
+]
+
+NOTEBOOK_EXCEPTIONS_INTRO_BLOCKS = [
+    {
+        "object": "block",
+        "type": "heading_2",
+        "heading_2": {
+            "rich_text": [{"type": "text", "text": {"content": "Partial Import Exceptions"}}]
+        },
+    },
+    {
+        "object": "block",
+        "type": "paragraph",
+        "paragraph": {
+            "rich_text": [
+                {
+                    "type": "text",
+                    "text": {
+                        "content": "Notes below encountered errors during import. "
+                        "Click each link to see the note with inline error details."
+                    },
+                }
+            ]
+        },
+    },
+    {"object": "block", "type": "divider", "divider": {}},
+]
+
+
+def _group_by_parent(items) -> dict[str | None, list[dict]]:
+    """Group search results by parent page ID (None for non-page parents)."""
+    grouped = {}
+    for item in items:
+        parent = item.get("parent", {})
+        parent_page_id = parent.get("page_id") if parent.get("type") == "page_id" else None
+        grouped.setdefault(parent_page_id, []).append(item)
+    return grouped
+
+
+def _block_link_rich_text(page_id: str | None, block_id: str) -> list[dict]:
+    """Rich text for a " [Block: <url>]" suffix linking to a block on its page."""
+    clean_block_id = block_id.replace("-", "")
+    sp = page_id.replace("-", "") if page_id else ""
+    block_url = f"https://www.notion.so/{sp}#{clean_block_id}" if sp else f"https://www.notion.so/{clean_block_id}"
+    return [
+        {"type": "text", "text": {"content": " [Block: "}},
+        {"type": "text", "text": {"content": block_url, "link": {"url": block_url}}},
+        {"type": "text", "text": {"content": "]"}},
+    ]
+
 
 class ExceptionTracker:
     """Tracks partial imports and maintains exception summary pages."""
@@ -29,19 +124,33 @@ class ExceptionTracker:
         self._exceptions_page_id = None
         self._notebook_exception_pages = {}  # notebook_name -> page_id
         self._special_pages_cache = {}  # title -> page_id (cached after first lookup/create)
+        self._child_pages = {}  # parent_id -> {title: page_id} of its child pages, listed on first use
         self._exceptions_database_id = None  # Database ID for user-actionable exceptions
-        self._exception_counter = {}  # Counter for generating unique titles
-        
+        self._exception_counter = {}  # (notebook, note title, error type) -> count, for unique titles
+        self._pending_exceptions = []  # Database entries queued until flush_exceptions()
+        self._pending_partial_imports = {}  # notebook_name -> [(note_title, page_id, entry block)]
+        self._pending_special_entries = {}  # special page_id -> [entry blocks]
+        self._seen_partial_imports = set()  # (notebook_name, page_id) already tracked
+        self._seen_special_entries = {}  # special page title -> entry keys already written to it
+        self._search_cache = {}  # (query, include_databases) -> (monotonic time, results)
+        self._live_pages = {}  # page_id -> whether entries may link to it, checked once per run
+        self._failure_counts = Counter()  # failure category -> count, for sampled logging
+        self._cleanup_done_for_db = set()  # Database IDs whose duplicates were already cleaned up
+
         # Initialize infrastructure cache
         cache_dir = working_dir or Path.cwd()
         self._cache = InfrastructureCache(cache_dir)
         logger.debug(f"Using cache directory: {cache_dir}")
     
-    def initialize_infrastructure(self):
+    def initialize_infrastructure(self, force_cleanup: bool = False):
         """Pre-create Exceptions page and User Action Required database.
         
         Call this at the start of import/link resolution to ensure infrastructure
         exists before any processing begins.
+        
+        Duplicate databases are looked for when the database had to be found
+        by search or created; a validated cache hit skips that search unless
+        `force_cleanup` is set.
         """
         logger.info("Initializing exception tracking infrastructure...")
         
@@ -54,8 +163,8 @@ class ExceptionTracker:
         if self._exceptions_database_id:
             logger.info(f"✓ User Action Required database ready: {self._exceptions_database_id}")
             
-            # Check for and clean up duplicate databases
-            self._cleanup_duplicate_databases()
+            if force_cleanup:
+                self._cleanup_duplicate_databases()
         
         logger.info("Exception tracking infrastructure initialized")
 
@@ -91,45 +200,21 @@ class ExceptionTracker:
         if not cached_id:
             logger.debug("No valid Exceptions page in cache")
 
-        # Search for existing "Exceptions" page
-        logger.debug("Searching for existing 'Exceptions' page...")
-        pages = self.wrapper.search_pages("Exceptions")
-        
-        # Filter out archived/deleted items
-        active_pages = [p for p in pages if not p.get("archived", False) and not p.get("in_trash", False)]
-
-        for page in active_pages:
-            if page.get("parent", {}).get("page_id") == self.root_id:
-                self._exceptions_page_id = page["id"]
-                logger.info("Found existing 'Exceptions' summary page")
-                self._cache.set_exceptions_page_id(self._exceptions_page_id)
-                return self._exceptions_page_id
+        # Look for an existing "Exceptions" page among the root's children
+        logger.debug("Looking for existing 'Exceptions' page...")
+        page_id = self._get_child_pages(self.root_id).get("Exceptions")
+        if page_id:
+            self._exceptions_page_id = page_id
+            logger.info("Found existing 'Exceptions' summary page")
+            self._cache.set_exceptions_page_id(self._exceptions_page_id)
+            return self._exceptions_page_id
 
-        # Create new exceptions page
+        # Create new exceptions page with its intro paragraph inline
         logger.info("Creating 'Exceptions' summary page...")
-        page = self.wrapper.create_page(parent_id=self.root_id, title="Exceptions")
+        page = self.wrapper.create_page(parent_id=self.root_id, title="Exceptions", children=EXCEPTIONS_INTRO_BLOCKS)
         self._exceptions_page_id = page["id"]
         self._cache.set_exceptions_page_id(self._exceptions_page_id)
-
-        # Add intro paragraph
-        intro_blocks = [
-            {
-                "object": "block",
-                "type": "paragraph",
-                "paragraph": {
-                    "rich_text": [
-                        {
-                            "type": "text",
-                            "text": {
-                                "content": "This page lists all partially imported notes with errors. "
-                                "Each notebook has a child page listing its exceptions."
-                            },
-                        }
-                    ]
-                },
-            }
-        ]
-        self.wrapper.append_blocks(block_id=self._exceptions_page_id, children=intro_blocks)
+        self._remember_child_page(self.root_id, "Exceptions", self._exceptions_page_id)
 
         return self._exceptions_page_id
 
@@ -154,6 +239,7 @@ class ExceptionTracker:
                 else:
                     # Cached DB has wrong schema, clear cache and recreate
                     logger.warning(f"Cached database {self._exceptions_database_id} has wrong schema (missing 'Error Type'), will recreate")
+                    self._cache.clear_by_id(self._exceptions_database_id)
                     self._exceptions_database_id = None
             except Exception as e:
                 error_msg = str(e).lower()
@@ -181,7 +267,6 @@ class ExceptionTracker:
                 # Database exists and is accessible - trust the cache
                 logger.info(f"✓ Using cached database: {cached_db_id}")
                 self._exceptions_database_id = cached_db_id
-                self._cleanup_duplicate_databases()
                 return
             except Exception as e:
                 error_msg = str(e).lower()
@@ -196,7 +281,7 @@ class ExceptionTracker:
         
         # Search Notion for existing database - search ALL databases, then filter by parent
         logger.info("Searching Notion for existing 'User Action Required' database...")
-        databases = self.wrapper.search_pages("User Action Required", include_databases=True)
+        databases = self._cached_search("User Action Required", include_databases=True)
         
         # Filter out archived/deleted items (in_trash or archived=true)
         active_databases = [
@@ -216,53 +301,44 @@ class ExceptionTracker:
             if databases_in_trash > 0:
                 logger.debug(f"  ({databases_in_trash} database(s) found in trash, ignoring)")
         
-        for db in active_databases:
-                db_id = db["id"]
-                parent = db.get("parent", {})
-                parent_page_id = parent.get("page_id")
-                
-                logger.debug(f"  Checking database {db_id}, parent: {parent_page_id}")
-                
-                # Check if parent is the exceptions page
-                if parent.get("type") == "page_id" and parent_page_id == exceptions_page_id:
-                    logger.info(f"  ✓ Database {db_id} is under Exceptions page, validating schema...")
-                    found_db_id = db_id
-                    # Verify it has the correct schema by checking for "Error Type" property
-                    try:
-                        db_schema = self.wrapper.get_database(found_db_id)
-                        properties = db_schema.get("properties", {})
-                        if "Error Type" in properties:
-                            self._exceptions_database_id = found_db_id
-                            logger.info(f"Found existing 'User Action Required' database: {self._exceptions_database_id}")
-                            # Cache the database ID
-                            self._cache.set_database_id("User Action Required", self._exceptions_database_id)
-                            # Clean up duplicates immediately
-                            self._cleanup_duplicate_databases()
-                            return
-                        else:
-                            # Database exists but has wrong schema - delete and recreate
-                            logger.warning(f"  ✗ Database has wrong schema (missing 'Error Type'), deleting: {found_db_id}")
-                            self.wrapper.delete_block(found_db_id)
-                            break
-                    except Exception as e:
-                        logger.warning(f"  ✗ Failed to validate database schema: {e}")
-                        break
+        # Group by parent page in one pass: candidates sit under the Exceptions
+        # page, databases under any other page are misplaced
+        by_parent = _group_by_parent(active_databases)
+        for db in by_parent.pop(exceptions_page_id, []):
+            db_id = db["id"]
+            logger.info(f"  ✓ Database {db_id} is under Exceptions page, validating schema...")
+            found_db_id = db_id
+            # Verify it has the correct schema by checking for "Error Type" property
+            try:
+                db_schema = self.wrapper.get_database(found_db_id)
+                properties = db_schema.get("properties", {})
+                if "Error Type" in properties:
+                    self._exceptions_database_id = found_db_id
+                    logger.info(f"Found existing 'User Action Required' database: {self._exceptions_database_id}")
+                    # Cache the database ID
+                    self._cache.set_database_id("User Action Required", self._exceptions_database_id)
+                    # Clean up duplicates immediately
+                    self._cleanup_duplicate_databases()
+                    return
                 else:
-                    logger.debug(f"  Skipping database {db_id} (wrong parent)")
+                    # Database exists but has wrong schema - delete and recreate
+                    logger.warning(f"  ✗ Database has wrong schema (missing 'Error Type'), deleting: {found_db_id}")
+                    self.wrapper.delete_block(found_db_id)
+                    self._cache.clear_by_id(found_db_id)
+                    self._invalidate_search("User Action Required")
+                    break
+            except Exception as e:
+                logger.warning(f"  ✗ Failed to validate database schema: {e}")
+                break
         
         # If we found databases with this name but under different parents, delete them
         # to avoid confusion (this handles the multiple databases issue)
-        for db in databases:
-            if db.get("object") == "database":
-                parent = db.get("parent", {})
-                if parent.get("type") == "page_id" and parent.get("page_id") != exceptions_page_id:
-                    db_id = db["id"]
-                    logger.warning(f"Found 'User Action Required' database in wrong location ({db_id}), deleting...")
-                    try:
-                        self.wrapper.delete_block(db_id)
-                        logger.info(f"Deleted misplaced database: {db_id}")
-                    except Exception as e:
-                        logger.warning(f"Failed to delete misplaced database: {e}")
+        by_parent.pop(None, None)  # Workspace-level or non-page parents are left alone
+        misplaced_ids = [db["id"] for dbs in by_parent.values() for db in dbs]
+        for db_id in misplaced_ids:
+            logger.warning(f"Found 'User Action Required' database in wrong location ({db_id}), deleting...")
+        if self._delete_blocks(misplaced_ids, "misplaced database"):
+            self._invalidate_search("User Action Required")
         
         # Create new database with schema
         logger.info("Creating 'User Action Required' database...")
@@ -281,57 +357,50 @@ class ExceptionTracker:
             properties_schema=schema
         )
         self._exceptions_database_id = db["id"]
+        self._invalidate_search("User Action Required")
         logger.info(f"Created 'User Action Required' database: {self._exceptions_database_id}")
         
         # Cache the database ID
         self._cache.set_database_id("User Action Required", self._exceptions_database_id)
         
-        # Wait for Notion to propagate the new database so search will find it
-        logger.debug("Waiting 5 seconds for database to propagate in Notion's search index...")
-        time.sleep(5)
-        
-        # Clean up any duplicates immediately after creation
+        # Clean up any duplicates immediately after creation; the new database
+        # is skipped by ID, so it doesn't need to be searchable yet
         self._cleanup_duplicate_databases()
     
     def _cleanup_duplicate_databases(self):
         """Find and delete duplicate 'User Action Required' databases.
         
         Keeps only the database stored in self._exceptions_database_id and deletes
-        all others with the same name.
+        all others with the same name. Runs at most once per run for a given
+        database.
         """
-        if not self._exceptions_database_id:
+        if not self._exceptions_database_id or self._exceptions_database_id in self._cleanup_done_for_db:
             return
         
         logger.debug("Checking for duplicate 'User Action Required' databases...")
         
         try:
             # Search for all databases with this name
-            databases = self.wrapper.search_pages("User Action Required", include_databases=True)
+            databases = self._cached_search("User Action Required", include_databases=True)
             
-            duplicates_found = 0
-            for db in databases:
-                if db.get("object") == "database":
-                    db_id = db["id"]
-                    # Skip the one we're keeping
-                    if db_id == self._exceptions_database_id:
-                        continue
-                    
-                    # Delete any other database with this name
-                    try:
-                        self.wrapper.delete_block(db_id)
-                        duplicates_found += 1
-                        logger.info(f"Deleted duplicate 'User Action Required' database: {db_id}")
-                    except Exception as e:
-                        logger.warning(f"Failed to delete duplicate database {db_id}: {e}")
+            # Delete every other database with this name, skipping the one we're keeping
+            duplicate_ids = [
+                db["id"]
+                for db in databases
+                if db.get("object") == "database" and db["id"] != self._exceptions_database_id
+            ]
+            duplicates_found = self._delete_blocks(duplicate_ids, "duplicate 'User Action Required' database")
             
             if duplicates_found > 0:
+                self._invalidate_search("User Action Required")
                 logger.info(f"Cleaned up {duplicates_found} duplicate database(s)")
             else:
                 logger.debug("No duplicate databases found")
+            self._cleanup_done_for_db.add(self._exceptions_database_id)
         except Exception as e:
             logger.warning(f"Failed to check for duplicate databases: {e}")
     
-    def add_exception_to_database(
+    def queue_exception(
         self,
         notebook_name: str,
         note_title: str,
@@ -340,8 +409,11 @@ class ExceptionTracker:
         error_detail: str = "",
         block_id: str = None
     ):
-        """Add a user-actionable exception entry to the database.
-        
+        """Queue a user-actionable exception entry for the database.
+
+        Entries are written by flush_exceptions(), which the uploader calls
+        once per note so all of a note's entries go out together.
+
         Args:
             notebook_name: Name of the source ENEX file (e.g., "Decisions.enex")
             note_title: Title of the note in Notion
@@ -350,30 +422,133 @@ class ExceptionTracker:
             error_detail: Additional details (e.g., filename, URL, etc.)
             block_id: Optional block ID to link directly to the user action marker block
         """
-        # Verify the page exists and isn't trashed
-        try:
-            page = self.wrapper.client.pages.retrieve(page_id=page_id)
-            if page.get("archived") or page.get("in_trash"):
-                logger.debug(f"Skipping exception database entry for trashed/archived page: {note_title}")
-                return
-        except Exception as e:
-            logger.debug(f"Skipping exception database entry for inaccessible page {note_title}: {e}")
+        self._pending_exceptions.append(
+            {
+                "notebook_name": notebook_name,
+                "note_title": note_title,
+                "page_id": page_id,
+                "error_type": error_type,
+                "error_detail": error_detail,
+                "block_id": block_id,
+            }
+        )
+
+    def flush_exceptions(self):
+        """Write all queued exception entries to the database.
+
+        Each source page is verified once, then the entries are created one
+        at a time; the wrapper paces the requests.
+        """
+        if not self._pending_exceptions:
             return
-        
+
+        pending = self._pending_exceptions
+        self._pending_exceptions = []
+
+        # Verify each source page exists and isn't trashed
+        live_pages = self._check_live_pages((entry["page_id"], entry["note_title"]) for entry in pending)
+
+        entries = [entry for entry in pending if live_pages[entry["page_id"]]]
+        if not entries:
+            return
+
         # Ensure database exists
         self.ensure_exceptions_page()
         if not self._exceptions_database_id:
             self._create_exceptions_database()
-        
+
+        for entry in entries:
+            self._create_exception_entry(*self._build_exception_entry(**entry))
+
+    def _delete_blocks(self, block_ids: list[str], description: str) -> int:
+        """Delete pages/databases; a failure doesn't stop the others.
+
+        Returns:
+            Number of blocks deleted
+        """
+        deleted = 0
+        for block_id in block_ids:
+            try:
+                self._call_with_retry(self.wrapper.delete_block, block_id=block_id)
+            except Exception as e:
+                logger.warning(f"Failed to delete {description} {block_id}: {e}")
+                continue
+            logger.info(f"Deleted {description}: {block_id}")
+            # Forget deleted IDs now rather than failing to validate them next run
+            self._cache.clear_by_id(block_id)
+            deleted += 1
+        return deleted
+
+    def remember_live_page(self, page_id: str):
+        """Record a page created during this run so its entries skip the existence check."""
+        self._live_pages[page_id] = True
+
+    def _check_live_pages(self, pages) -> dict[str, bool]:
+        """Check which source pages exist and aren't trashed.
+
+        Each page is retrieved at most once per run; pages passed to
+        remember_live_page() aren't retrieved at all.
+
+        Args:
+            pages: Iterable of (page_id, note_title) pairs; titles are for logging
+
+        Returns:
+            Dict mapping each page ID to True if entries may link to it
+        """
+        live_pages = {}
+        for page_id, note_title in pages:
+            if page_id in live_pages:
+                continue
+            if page_id in self._live_pages:
+                live_pages[page_id] = self._live_pages[page_id]
+                continue
+            try:
+                page = self.wrapper.client.pages.retrieve(page_id=page_id)
+                live_pages[page_id] = not (page.get("archived") or page.get("in_trash"))
+                if not live_pages[page_id]:
+                    logger.debug("Skipping exception tracking for trashed/archived page: %s", note_title)
+            except Exception as e:
+                logger.debug("Skipping exception tracking for inaccessible page %s: %s", note_title, e)
+                live_pages[page_id] = False
+            self._live_pages[page_id] = live_pages[page_id]
+        return live_pages
+
+    def _log_failure(self, category: str, message: str, *args, level: int = logging.WARNING):
+        """Log a failed write, demoting to DEBUG after FAILURE_LOG_LIMIT of a category.
+
+        flush() reports how many were demoted, so a storm of identical
+        failures (e.g. persistent 429s) doesn't flood the log.
+        """
+        self._failure_counts[category] += 1
+        count = self._failure_counts[category]
+        logger.log(level if count <= FAILURE_LOG_LIMIT else logging.DEBUG, message, *args)
+
+    def reset_notebook_counters(self, notebook_name: str):
+        """Drop a finished notebook's title counters so they don't pile up over a long import."""
+        self._exception_counter = {
+            key: count for key, count in self._exception_counter.items() if key[0] != notebook_name
+        }
+
+    def _build_exception_entry(
+        self,
+        notebook_name: str,
+        note_title: str,
+        page_id: str,
+        error_type: str,
+        error_detail: str,
+        block_id: str | None,
+    ) -> tuple[str, dict[str, Any], str]:
+        """Build (title, properties, detail) for a database entry."""
         # Generate unique title
-        counter_key = f"{notebook_name}-{note_title}-{error_type}"
+        counter_key = (notebook_name, note_title, error_type)
         count = self._exception_counter.get(counter_key, 0) + 1
         self._exception_counter[counter_key] = count
         
         # Format title: <note-title>-<error-type>-<count>
         # Truncate note title to keep total length reasonable
         safe_note_title = note_title[:80] if note_title else "Untitled"
-        title_text = f"{safe_note_title}-{error_type.replace(' ', '')}-{count}"
+        error_slug = ERROR_TYPE_SLUGS.get(error_type) or error_type.replace(" ", "")
+        title_text = f"{safe_note_title}-{error_slug}-{count}"
         
         # Create block link - use block-level link if block_id provided, otherwise page-level
         if block_id:
@@ -394,86 +569,63 @@ class ExceptionTracker:
             "Error Type": {"select": {"name": error_type}},
             "Block Link": {"url": block_link},
         }
-        
+
+        return title_text, properties, error_detail
+
+    def _create_exception_entry(self, title_text: str, properties: dict[str, Any], error_detail: str):
+        """Create a single database entry page."""
         try:
             self.wrapper.create_page(
                 parent_id=self._exceptions_database_id,
                 title=title_text,
                 properties=properties
             )
-            logger.debug(f"Added exception to database: {title_text} ({error_detail})")
+            logger.debug("Added exception to database: %s (%s)", title_text, error_detail)
         except Exception as e:
-            logger.warning(f"Failed to add exception to database: {e}")
+            self._log_failure("database entry", "Failed to add exception to database: %s", e)
 
-    def ensure_notebook_exception_page(self, notebook_name: str) -> str:
+    def ensure_notebook_exception_page(self, notebook_name: str, children: list[dict] | None = None) -> tuple[str, bool]:
         """Get or create exception page for a specific notebook.
 
         Args:
             notebook_name: Notebook name (e.g., "MyNotebook.enex")
+            children: Blocks to write after the intro if the page is created here
 
         Returns:
-            Notebook exception page ID
+            Tuple of (notebook exception page ID, whether `children` were written)
         """
         if notebook_name in self._notebook_exception_pages:
-            return self._notebook_exception_pages[notebook_name]
+            return self._notebook_exception_pages[notebook_name], False
 
         exceptions_page_id = self.ensure_exceptions_page()
 
-        # Search for existing notebook exception page as child of Exceptions page
+        # Look for existing notebook exception page among the Exceptions page's children
         page_title = f"{notebook_name}"
-        logger.debug(f"Searching for existing exception page for '{page_title}'...")
-        pages = self.wrapper.search_pages(page_title)
-        
-        # Filter out archived/deleted items
-        active_pages = [p for p in pages if not p.get("archived", False) and not p.get("in_trash", False)]
-
-        for page in active_pages:
-            if page.get("parent", {}).get("page_id") == exceptions_page_id:
-                page_id = page["id"]
-                self._notebook_exception_pages[notebook_name] = page_id
-                logger.debug(f"Found existing notebook exception page: {page_title}")
-                return page_id
+        page_id = self._get_child_pages(exceptions_page_id).get(page_title)
+        if page_id:
+            self._notebook_exception_pages[notebook_name] = page_id
+            logger.debug(f"Found existing notebook exception page: {page_title}")
+            return page_id, False
 
-        # Create new notebook exception page
+        # Create new notebook exception page with the intro and first entries inline
         logger.debug(f"Creating notebook exception page: {page_title}")
-        page = self.wrapper.create_page(parent_id=exceptions_page_id, title=page_title)
+        page = self.wrapper.create_page(
+            parent_id=exceptions_page_id, title=page_title, children=NOTEBOOK_EXCEPTIONS_INTRO_BLOCKS + (children or [])
+        )
         page_id = page["id"]
         self._notebook_exception_pages[notebook_name] = page_id
+        self._remember_child_page(exceptions_page_id, page_title, page_id)
 
-        # Add intro paragraph
-        intro_blocks = [
-            {
-                "object": "block",
-                "type": "heading_2",
-                "heading_2": {
-                    "rich_text": [{"type": "text", "text": {"content": "Partial Import Exceptions"}}]
-                },
-            },
-            {
-                "object": "block",
-                "type": "paragraph",
-                "paragraph": {
-                    "rich_text": [
-                        {
-                            "type": "text",
-                            "text": {
-                                "content": "Notes below encountered errors during import. "
-                                "Click each link to see the note with inline error details."
-                            },
-                        }
-                    ]
-                },
-            },
-            {"object": "block", "type": "divider", "divider": {}},
-        ]
-        self.wrapper.append_blocks(block_id=page_id, children=intro_blocks)
-
-        return page_id
+        return page_id, True
 
     def track_partial_import(
         self, notebook_name: str, note_title: str, page_id: str, errors: list[str]
     ):
-        """Record a partial import exception and append to notebook exception page.
+        """Record a partial import exception for the notebook exception page.
+
+        Entries are buffered per notebook and appended in batches by
+        flush_partial_imports(), which runs automatically once a notebook
+        has PARTIAL_IMPORT_BATCH_SIZE entries waiting.
 
         Args:
             notebook_name: Name of notebook
@@ -481,17 +633,11 @@ class ExceptionTracker:
             page_id: Notion page ID of the partially imported note
             errors: List of error messages
         """
-        # Verify the page exists and isn't trashed
-        try:
-            page = self.wrapper.client.pages.retrieve(page_id=page_id)
-            if page.get("archived") or page.get("in_trash"):
-                logger.debug(f"Skipping exception tracking for trashed/archived page: {note_title}")
-                return
-        except Exception as e:
-            logger.debug(f"Skipping exception tracking for inaccessible page {note_title}: {e}")
+        # Retry paths can report the same note again; one entry is enough
+        if (notebook_name, page_id) in self._seen_partial_imports:
+            logger.debug("Partial import for note '%s' already tracked, skipping", note_title)
             return
-        
-        notebook_exception_page_id = self.ensure_notebook_exception_page(notebook_name)
+        self._seen_partial_imports.add((notebook_name, page_id))
 
         # Create blocks to append
         blocks = []
@@ -516,18 +662,17 @@ class ExceptionTracker:
 
         # Indented error messages as nested bullets
         if errors:
-            error_items = []
-            for error in errors[:10]:  # Limit to first 10 errors to avoid huge lists
-                error_items.append(
-                    {
-                        "object": "block",
-                        "type": "bulleted_list_item",
-                        "bulleted_list_item": {
-                            "rich_text": [{"type": "text", "text": {"content": error}}],
-                            "color": "red",
-                        },
-                    }
-                )
+            error_items = [
+                {
+                    "object": "block",
+                    "type": "bulleted_list_item",
+                    "bulleted_list_item": {
+                        "rich_text": [{"type": "text", "text": {"content": error}}],
+                        "color": "red",
+                    },
+                }
+                for error in islice(errors, 10)  # Limit to first 10 errors to avoid huge lists
+            ]
 
             if len(errors) > 10:
                 error_items.append(
@@ -546,29 +691,56 @@ class ExceptionTracker:
                     }
                 )
 
-            # Append error items as children to the main bullet
-            # Note: Official API requires separate append for nested children
-            # We'll append the main bullet first, then its children
-            try:
-                result = self.wrapper.append_blocks(
-                    block_id=notebook_exception_page_id, children=[blocks[0]]
-                )
-                if result and len(result) > 0:
-                    parent_block_id = result[0]["id"]
-                    self.wrapper.append_blocks(block_id=parent_block_id, children=error_items)
-            except Exception as e:
-                logger.error(f"Failed to append exception entry: {e}")
-                logger.debug(e, exc_info=e)
+            # Nest error items under the main bullet; the API accepts children
+            # inline on append, so the entry is written in a single request
+            blocks[0]["bulleted_list_item"]["children"] = error_items
+
+        pending = self._pending_partial_imports.setdefault(notebook_name, [])
+        pending.append((note_title, page_id, blocks[0]))
+        logger.debug("Tracked partial import for note '%s' in notebook '%s'", note_title, notebook_name)
+
+        if len(pending) >= PARTIAL_IMPORT_BATCH_SIZE:
+            self.flush_partial_imports(notebook_name)
+
+    def flush_partial_imports(self, notebook_name: str | None = None):
+        """Append buffered partial-import entries to their notebook exception pages.
+
+        Args:
+            notebook_name: Only flush this notebook's entries (default: all notebooks)
+        """
+        if notebook_name is None:
+            notebook_names = list(self._pending_partial_imports)
         else:
-            # No errors to nest, just append the main bullet
+            notebook_names = [notebook_name]
+
+        for name in notebook_names:
+            pending = self._pending_partial_imports.pop(name, None)
+            if not pending:
+                continue
+
+            # Verify each page exists and isn't trashed
+            live_pages = self._check_live_pages((page_id, note_title) for note_title, page_id, _ in pending)
+            entries = [entry for note_title, page_id, entry in pending if live_pages[page_id]]
+            if not entries:
+                continue
+
             try:
-                self.wrapper.append_blocks(block_id=notebook_exception_page_id, children=blocks)
+                # A page created here gets the first batch inline with its intro
+                first_batch = entries[:PARTIAL_IMPORT_BATCH_SIZE]
+                notebook_exception_page_id, written = self.ensure_notebook_exception_page(name, first_batch)
+                remaining_from = len(first_batch) if written else 0
+                for start in range(remaining_from, len(entries), PARTIAL_IMPORT_BATCH_SIZE):
+                    self._append(
+                        block_id=notebook_exception_page_id,
+                        children=entries[start : start + PARTIAL_IMPORT_BATCH_SIZE],
+                    )
             except Exception as e:
-                logger.error(f"Failed to append exception entry: {e}")
+                self._log_failure(
+                    "partial import", "Failed to append exception entries for notebook '%s': %s", name, e,
+                    level=logging.ERROR,
+                )
                 logger.debug(e, exc_info=e)
 
-        logger.debug(f"Tracked partial import for note '{note_title}' in notebook '{notebook_name}'")
-
     # New: generic special exception page and unmatched link tracking
     def _ensure_special_child_page(self, title: str, recreate: bool = False) -> str:
         """Get or create a special exception child page.
@@ -588,54 +760,115 @@ class ExceptionTracker:
         
         # Delete ALL existing pages with this title if recreate requested
         if recreate:
-            pages = self.wrapper.search_pages(title)
-            deleted_count = 0
-            deleted_ids = []
-            for page in pages:
-                if page.get("parent", {}).get("page_id") == exceptions_page_id:
-                    try:
-                        page_id = page["id"]
-                        self.wrapper.delete_block(block_id=page_id)
-                        deleted_ids.append(page_id)
-                        deleted_count += 1
-                        logger.info(f"Deleted existing exception page: {title} ({page_id})")
-                    except Exception as e:
-                        logger.warning(f"Failed to delete page '{title}' ({page['id']}): {e}")
+            # List the Exceptions page's children rather than searching the
+            # workspace: only direct children come back, and there is no
+            # search index to wait on after deleting
+            pages = [
+                block
+                for block in self.wrapper.list_child_pages(exceptions_page_id)
+                if block["child_page"]["title"] == title
+            ]
+            deleted_count = self._delete_blocks([page["id"] for page in pages], f"existing exception page '{title}'")
             
-            if deleted_count > 0:
-                if deleted_count > 1:
-                    logger.info(f"Deleted {deleted_count} duplicate '{title}' pages")
-                # Wait for deletion to propagate in Notion's system
-                logger.debug(f"Waiting 2s for deletion to propagate...")
-                time.sleep(2)
+            if deleted_count > 1:
+                logger.info(f"Deleted {deleted_count} duplicate '{title}' pages")
             
             # Clear cache since we deleted
+            for page in pages:
+                self._pending_special_entries.pop(page["id"], None)
             self._special_pages_cache.pop(title, None)
+            self._child_pages.get(exceptions_page_id, {}).pop(title, None)
+            self._seen_special_entries.pop(title, None)
         
         # Find existing page (if not recreating) - use FIRST match
         if not recreate:
-            pages = self.wrapper.search_pages(title)
-            for page in pages:
-                if page.get("parent", {}).get("page_id") == exceptions_page_id:
-                    page_id = page["id"]
-                    self._special_pages_cache[title] = page_id
-                    logger.debug(f"Found existing exception page: {title}")
-                    return page_id
+            page_id = self._get_child_pages(exceptions_page_id).get(title)
+            if page_id:
+                self._special_pages_cache[title] = page_id
+                logger.debug(f"Found existing exception page: {title}")
+                return page_id
         
         # Create new page
         logger.info(f"Creating new exception page: {title}")
         page = self.wrapper.create_page(parent_id=exceptions_page_id, title=title)
         page_id = page["id"]
         self._special_pages_cache[title] = page_id
+        self._remember_child_page(exceptions_page_id, title, page_id)
         return page_id
 
+    def _cached_search(self, query: str, include_databases: bool = False, ttl: float = SEARCH_CACHE_TTL) -> list[dict]:
+        """search_pages() with results reused for `ttl` seconds."""
+        key = (query, include_databases)
+        cached = self._search_cache.get(key)
+        if cached and time.monotonic() - cached[0] < ttl:
+            return cached[1]
+        results = self.wrapper.search_pages(query, include_databases=include_databases)
+        self._search_cache[key] = (time.monotonic(), results)
+        return results
+
+    def _invalidate_search(self, query: str):
+        """Drop cached search results for a title after creating/deleting one."""
+        self._search_cache.pop((query, False), None)
+        self._search_cache.pop((query, True), None)
+
+    def _call_with_retry(self, func, idempotent: bool = True, **kwargs):
+        """Call a wrapper method, retrying network errors and 5xx responses.
+
+        429s are already retried inside the wrapper. Non-idempotent calls
+        (appends) aren't retried after a read timeout or a 502/504, either
+        of which may have applied the request and would duplicate the
+        blocks. Page/entry creation isn't retried here since a 5xx may still
+        have created the page.
+        """
+        return retry_on_transient_errors(lambda: func(**kwargs), idempotent=idempotent)
+
+    def _append(self, block_id: str, children: list[dict]) -> list[dict]:
+        """Append blocks with retries, so a transient error doesn't drop the entries."""
+        return self._call_with_retry(
+            self.wrapper.append_blocks, idempotent=False, block_id=block_id, children=children
+        )
+
+    def _get_child_pages(self, parent_id: str) -> dict[str, str]:
+        """Map titles to IDs of a page's child pages.
+        
+        Each parent is listed once on first use (first page wins for
+        duplicate titles) and kept up to date as pages are created here, so
+        lookups don't cost a search request each.
+        """
+        child_pages = self._child_pages.get(parent_id)
+        if child_pages is None:
+            child_pages = {}
+            for block in self.wrapper.list_child_pages(parent_id):
+                child_pages.setdefault(block["child_page"]["title"], block["id"])
+            self._child_pages[parent_id] = child_pages
+        return child_pages
+
+    def _remember_child_page(self, parent_id: str, title: str, page_id: str):
+        """Record a newly created child page if its parent has been listed."""
+        if parent_id in self._child_pages:
+            self._child_pages[parent_id][title] = page_id
+
+    def _already_tracked(self, page_title: str, key) -> bool:
+        """Check whether an entry was already written to a special page this run.
+
+        Marks the entry as written if it wasn't. Recreating the page resets it.
+        """
+        seen = self._seen_special_entries.setdefault(page_title, set())
+        if key in seen:
+            return True
+        seen.add(key)
+        return False
+
     def track_unmatched_link(self, source_page_title: str, source_page_id: str, link_text: str, original_url: str, block_id: str = None, recreate: bool = False):
         """Record an unmatched evernote link.
 
-        Appends a toggle to Exceptions → EvernoteLinkFailure with a mention to the source page,
+        Queues a toggle for Exceptions → EvernoteLinkFailure with a mention to the source page,
         the link_text used for matching, the original URL, and optional block URL.
+        Entries are written in batches; call flush() when tracking is finished.
         """
         page_id = self._ensure_special_child_page("EvernoteLinkFailure", recreate=recreate)
+        if self._already_tracked("EvernoteLinkFailure", (source_page_id, link_text, original_url, block_id)):
+            return
         
         # Build rich_text with page mention and link details
         rich_text = [
@@ -645,14 +878,7 @@ class ExceptionTracker:
         
         # Add block URL if provided
         if block_id:
-            clean_block_id = block_id.replace("-", "")
-            sp = source_page_id.replace("-", "") if source_page_id else ""
-            block_url = f"https://www.notion.so/{sp}#{clean_block_id}" if sp else f"https://www.notion.so/{clean_block_id}"
-            rich_text.extend([
-                {"type": "text", "text": {"content": " [Block: "}},
-                {"type": "text", "text": {"content": block_url, "link": {"url": block_url}}},
-                {"type": "text", "text": {"content": "]"}},
-            ])
+            rich_text.extend(_block_link_rich_text(source_page_id, block_id))
         
         toggle = {
             "object": "block",
@@ -661,18 +887,20 @@ class ExceptionTracker:
                 "rich_text": rich_text
             }
         }
-        try:
-            self.wrapper.append_blocks(block_id=page_id, children=[toggle])
-        except Exception as e:
-            logger.warning(f"Failed to append unmatched link entry: {e}")
+        self._queue_special_entry(page_id, toggle)
 
     def track_ambiguous_link(self, source_page_title: str, source_page_id: str, link_text: str, candidate_ids: list[tuple[str, str]], block_id: str = None, recreate: bool = False):
         """Record an ambiguous evernote link with multiple candidate pages.
 
-        Appends a toggle to Exceptions → UnresolvableEvernoteLinks with a mention to the source page,
+        Queues a toggle for Exceptions → UnresolvableEvernoteLinks with a mention to the source page,
         the link_text used for matching, and a sub-list of candidate page mentions.
+        Entries are written in batches; call flush() when tracking is finished.
         """
         page_id = self._ensure_special_child_page("UnresolvableEvernoteLinks", recreate=recreate)
+        if self._already_tracked(
+            "UnresolvableEvernoteLinks", (source_page_id, link_text, tuple(cid for cid, _ in candidate_ids))
+        ):
+            return
         
         # Build rich_text for toggle header
         rich_text = [
@@ -682,14 +910,7 @@ class ExceptionTracker:
         
         # Add block URL if provided
         if block_id:
-            clean_block_id = block_id.replace("-", "")
-            sp = source_page_id.replace("-", "") if source_page_id else ""
-            block_url = f"https://www.notion.so/{sp}#{clean_block_id}" if sp else f"https://www.notion.so/{clean_block_id}"
-            rich_text.extend([
-                {"type": "text", "text": {"content": " [Block: "}},
-                {"type": "text", "text": {"content": block_url, "link": {"url": block_url}}},
-                {"type": "text", "text": {"content": "]"}},
-            ])
+            rich_text.extend(_block_link_rich_text(source_page_id, block_id))
         
         # Parent toggle
         parent = {
@@ -712,13 +933,10 @@ class ExceptionTracker:
                     ]
                 }
             })
-        try:
-            result = self.wrapper.append_blocks(block_id=page_id, children=[parent])
-            if result and children:
-                parent_id = result[0]["id"]
-                self.wrapper.append_blocks(block_id=parent_id, children=children)
-        except Exception as e:
-            logger.warning(f"Failed to append ambiguous link entry: {e}")
+        # Candidates go inline as the toggle's children, so it's a single append
+        if children:
+            parent["toggle"]["children"] = children
+        self._queue_special_entry(page_id, parent)
 
     def track_duplicate_page_names(self, duplicates: dict[str | None, list[str]], recreate: bool = True):
         """Record duplicate page names and link to all duplicates.
@@ -729,9 +947,14 @@ class ExceptionTracker:
         """
         page_id = self._ensure_special_child_page("DuplicatePageNames", recreate=recreate)
         
-        for title, ids in duplicates.items():
-            if len(ids) < 2 and title is not None:
-                continue
+        entries = []  # (display_title, parent toggle, child bullets beyond the inline 100)
+        # Only titles shared by 2+ pages, plus blank titles, are reported
+        relevant = (
+            (title, ids)
+            for title, ids in duplicates.items()
+            if (len(ids) >= 2 or title is None) and not self._already_tracked("DuplicatePageNames", title)
+        )
+        for title, ids in relevant:
             
             # Use "Blank-Page-Titles" for None/empty titles
             display_title = "Blank-Page-Titles" if title is None or title == "" else title
@@ -745,29 +968,108 @@ class ExceptionTracker:
                 }
             }
             
-            # Append parent, then children with page mentions and block URLs
+            # Children with page mentions and block URLs
+            child_bullets = []
+            for pid in ids:
+                # Create block URL
+                clean_id = pid.replace("-", "")
+                block_url = f"https://www.notion.so/{clean_id}"
+                
+                child_bullets.append({
+                    "object": "block",
+                    "type": "bulleted_list_item",
+                    "bulleted_list_item": {
+                        "rich_text": [
+                            {"type": "mention", "mention": {"type": "page", "page": {"id": pid}}},
+                            {"type": "text", "text": {"content": " – "}},
+                            {"type": "text", "text": {"content": block_url, "link": {"url": block_url}}},
+                        ]
+                    }
+                })
+            
+            # Send the parent with its first 100 children inline (the API's limit
+            # per children array); only larger groups need follow-up appends
+            if child_bullets:
+                parent["toggle"]["children"] = child_bullets[:MAX_APPEND_CHILDREN]
+            entries.append((display_title, parent, child_bullets[MAX_APPEND_CHILDREN:]))
+
+        # Write the toggles together, as many per request as the block limits allow
+        batch, batch_blocks = [], 0
+        for entry in entries:
+            entry_blocks = 1 + len(entry[1]["toggle"].get("children", []))
+            if batch and (len(batch) == MAX_APPEND_CHILDREN or batch_blocks + entry_blocks > MAX_APPEND_TOTAL_BLOCKS):
+                self._append_duplicate_entries(page_id, batch)
+                batch, batch_blocks = [], 0
+            batch.append(entry)
+            batch_blocks += entry_blocks
+        if batch:
+            self._append_duplicate_entries(page_id, batch)
+
+    def _append_duplicate_entries(self, page_id: str, entries: list[tuple[str, dict, list[dict]]]):
+        """Append duplicate-title toggles in one request, then any overflow bullets under each."""
+        try:
+            created = self._append(block_id=page_id, children=[parent for _, parent, _ in entries])
+        except Exception as e:
+            self._log_failure(
+                "duplicate name", "Failed to log %d duplicate title(s) '%s' … '%s': %s",
+                len(entries), entries[0][0], entries[-1][0], e,
+            )
+            return
+        for (display_title, _, overflow), block in zip(entries, created):
+            if not overflow:
+                continue
+            try:
+                self._append(block_id=block["id"], children=overflow)
+            except Exception as e:
+                self._log_failure("duplicate name", "Failed to log duplicate title '%s': %s", display_title, e)
+
+    def _queue_special_entry(self, page_id: str, block: dict):
+        """Buffer an entry for a special page; flush_special_entries() writes it."""
+        pending = self._pending_special_entries.setdefault(page_id, [])
+        pending.append(block)
+        if len(pending) >= SPECIAL_ENTRY_BATCH_SIZE:
+            self.flush_special_entries(page_id)
+
+    def flush_special_entries(self, page_id: str | None = None):
+        """Append buffered link-failure entries to their special pages.
+
+        Args:
+            page_id: Only flush this page's entries (default: all pages)
+        """
+        page_ids = list(self._pending_special_entries) if page_id is None else [page_id]
+        for target_id in page_ids:
+            entries = self._pending_special_entries.pop(target_id, None)
+            if not entries:
+                continue
+            try:
+                for start in range(0, len(entries), SPECIAL_ENTRY_BATCH_SIZE):
+                    self._append(block_id=target_id, children=entries[start : start + SPECIAL_ENTRY_BATCH_SIZE])
+            except Exception as e:
+                self._log_failure("link entry", "Failed to append %d link entries: %s", len(entries), e)
+
+    def flush(self):
+        """Write everything still buffered. Call once tracking is finished.
+
+        Target pages are flushed one after another, each page's entries in
+        order; the wrapper's token bucket paces the requests.
+        """
+        self._flush_pending()
+
+        for category, count in sorted(self._failure_counts.items()):
+            if count > FAILURE_LOG_LIMIT:
+                logger.warning(
+                    "%d %s write(s) failed in total (%d not shown above; see debug log)",
+                    count, category, count - FAILURE_LOG_LIMIT,
+                )
+        # Reported; a later flush() only summarizes failures since this one
+        self._failure_counts.clear()
+
+    def _flush_pending(self):
+        """Flush every target page's buffered entries; a failure doesn't stop the others."""
+        jobs = [(self.flush_partial_imports, name) for name in self._pending_partial_imports]
+        jobs += [(self.flush_special_entries, page_id) for page_id in self._pending_special_entries]
+        for flush_target, target in jobs:
             try:
-                res = self.wrapper.append_blocks(block_id=page_id, children=[parent])
-                if res:
-                    parent_block_id = res[0]["id"]
-                    child_bullets = []
-                    for pid in ids:
-                        # Create block URL
-                        clean_id = pid.replace("-", "")
-                        block_url = f"https://www.notion.so/{clean_id}"
-                        
-                        child_bullets.append({
-                            "object": "block",
-                            "type": "bulleted_list_item",
-                            "bulleted_list_item": {
-                                "rich_text": [
-                                    {"type": "mention", "mention": {"type": "page", "page": {"id": pid}}},
-                                    {"type": "text", "text": {"content": " – "}},
-                                    {"type": "text", "text": {"content": block_url, "link": {"url": block_url}}},
-                                ]
-                            }
-                        })
-                    if child_bullets:
-                        self.wrapper.append_blocks(block_id=parent_block_id, children=child_bullets)
+                flush_target(target)
             except Exception as e:
-                logger.warning(f"Failed to log duplicate title '{display_title}': {e}")
+                logger.warning(f"Failed to flush exception entries: {e}")
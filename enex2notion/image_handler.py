@@ -6,6 +6,7 @@ using the official Direct Upload API.
 import logging
 import mimetypes
 import os
+import random
 import time
 from pathlib import Path
 from typing import Optional
@@ -101,7 +102,11 @@ def upload_image_to_notion(
             ])
             
             if is_transient and not is_last_attempt:
-                wait_time = (2 ** attempt) * 0.5  # 0.5s, 1s, 2s
+                if any(x in error_msg_lower for x in ["rate limit", "429", "503"]):
+                    # Throttled - back off harder, with jitter so concurrent workers don't retry in lockstep
+                    wait_time = min(2 ** attempt + random.random(), 30)
+                else:
+                    wait_time = (2 ** attempt) * 0.5  # 0.5s, 1s, 2s
                 logger.warning(f"Transient error uploading {filename} (attempt {attempt + 1}/{max_retries}): {e}")
                 logger.debug(f"  Retrying in {wait_time}s...")
                 time.sleep(wait_time)
@@ -127,3 +127,20 @@ class InfrastructureCache:
             del self.databases[database_name]
             self._save()
             logger.debug(f"Removed database '{database_name}' from cache")
+    
+    def clear_by_id(self, item_id: str):
+        """Remove every cache entry pointing at an ID (e.g. after deleting it).
+        
+        Args:
+            item_id: Page or database ID that no longer exists
+        """
+        changed = False
+        if self.exceptions_page_id == item_id:
+            self.exceptions_page_id = None
+            changed = True
+        for name in [name for name, db_id in self.databases.items() if db_id == item_id]:
+            del self.databases[name]
+            changed = True
+        if changed:
+            self._save()
+            logger.debug(f"Removed {item_id} from cache")
@@ -6,27 +6,53 @@ using the official notion-client package with Integration tokens.
 Note: Database creation uses raw requests due to notion-client 2.7.0 bug
 that silently drops the 'properties' parameter.
 """
+import importlib.util
 import logging
+import random
+import threading
 import time
 from typing import Any, Callable
+import httpx
 import requests
-from requests.exceptions import Timeout, ConnectionError
+from requests.adapters import HTTPAdapter
+from requests.exceptions import Timeout, ConnectionError, ReadTimeout
 
 from notion_client import Client
-from notion_client.errors import APIResponseError
+from notion_client.errors import APIResponseError, HTTPResponseError, RequestTimeoutError
 
 logger = logging.getLogger(__name__)
 
 NOTION_API_VERSION = "2022-06-28"
 
+# HTTP/2 lets the upload/append worker threads share one TLS session;
+# httpx needs the optional 'h2' package for it (pip install httpx[http2])
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
 
-def _retry_on_transient_errors(func: Callable, max_retries: int = 3, initial_delay: float = 1.0) -> Any:
+# Failures after which the request may still have been applied: timeouts
+# (notion-client turns every httpx timeout into RequestTimeoutError) and
+# gateway errors, which can come back after Notion processed the request
+READ_TIMEOUT_ERRORS = (ReadTimeout, httpx.ReadTimeout, RequestTimeoutError)
+GATEWAY_ERROR_STATUSES = (502, 504)
+
+
+def retry_on_transient_errors(
+    func: Callable, max_retries: int = 3, initial_delay: float = 1.0, idempotent: bool = True
+) -> Any:
     """Retry a function call on transient errors with exponential backoff.
     
+    Retries network errors and 5xx responses (including the
+    UnknownHTTPResponseError notion-client raises for an HTML gateway page).
+    429s are left to the wrapper's own rate-limit retry. Waits for a
+    Retry-After header when given; otherwise the delay doubles each attempt,
+    with up to 25% jitter so parallel callers don't retry in lockstep.
+    
     Args:
         func: Function to call
         max_retries: Maximum number of retry attempts
         initial_delay: Initial delay in seconds (doubles each retry)
+        idempotent: Set False for calls that mustn't run twice (e.g. appends);
+            read timeouts and 502/504s are then raised instead of retried,
+            since the server may already have applied the request
     
     Returns:
         Function result
@@ -40,26 +66,27 @@ def _retry_on_transient_errors(func: Callable, max_retries: int = 3, initial_del
     for attempt in range(max_retries + 1):
         try:
             return func()
-        except (Timeout, ConnectionError, APIResponseError) as e:
+        except (Timeout, ConnectionError, httpx.TransportError, RequestTimeoutError, HTTPResponseError) as e:
             last_exception = e
             
             # Check if error is transient (retryable)
-            is_transient = False
-            error_str = str(e).lower()
-            
-            if isinstance(e, (Timeout, ConnectionError)):
+            if isinstance(e, HTTPResponseError):
+                # Retry on 500, 502 (Bad Gateway), 503 (Service Unavailable), 504
+                is_transient = e.status in (500, 502, 503, 504)
+                if e.status in GATEWAY_ERROR_STATUSES:
+                    is_transient = idempotent
+            elif isinstance(e, READ_TIMEOUT_ERRORS):
+                is_transient = idempotent
+            else:
                 is_transient = True
-            elif isinstance(e, APIResponseError):
-                # Retry on 502 (Bad Gateway), 503 (Service Unavailable), 429 (Rate Limit)
-                if hasattr(e, 'code'):
-                    is_transient = e.code in [502, 503, 429, 500]
-                else:
-                    is_transient = any(x in error_str for x in ['502', '503', '429', '500', 'bad gateway', 'timeout'])
             
             if is_transient and attempt < max_retries:
+                wait_time = retry_after_seconds(e)
+                if wait_time is None:
+                    wait_time = delay * random.uniform(1.0, 1.25)
                 logger.warning(f"Transient error (attempt {attempt + 1}/{max_retries + 1}): {e}")
-                logger.info(f"Retrying in {delay:.1f}s...")
-                time.sleep(delay)
+                logger.info(f"Retrying in {wait_time:.1f}s...")
+                time.sleep(wait_time)
                 delay *= 2  # Exponential backoff
             else:
                 # Non-transient error or max retries reached
@@ -71,6 +98,57 @@ def _retry_on_transient_errors(func: Callable, max_retries: int = 3, initial_del
     raise last_exception
 
 
+def retry_after_seconds(error: Exception) -> float | None:
+    """Return the server-advised wait from a Retry-After header, if any.
+
+    Only HTTPResponseError carries response headers; other errors (and
+    HTTP-date values, which Notion doesn't send) return None.
+    """
+    headers = getattr(error, "headers", None)
+    if not headers:
+        return None
+    try:
+        return max(float(headers.get("Retry-After")), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+class TokenBucket:
+    """Thread-safe token bucket: `rate` tokens per second, bursts up to `capacity`."""
+
+    def __init__(self, rate: float, capacity: int):
+        self._rate = rate
+        self._capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Take one token, sleeping until it is available.
+
+        The token is reserved under the lock (the balance may go negative)
+        and the sleep happens outside it, so waiting threads queue up in
+        order instead of blocking each other.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self._capacity, self._tokens + (now - self._updated) * self._rate)
+            self._updated = now
+            self._tokens -= 1
+            wait = -self._tokens / self._rate if self._tokens < 0 else 0
+
+        if wait > 0:
+            time.sleep(wait)
+
+    def pause(self, seconds: float):
+        """Hold back all threads so the next token is issued `seconds` from now."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self._capacity, self._tokens + (now - self._updated) * self._rate)
+            self._updated = now
+            self._tokens = min(self._tokens, 1 - seconds * self._rate)
+
+
 class NotionAPIWrapper:
     """Wrapper around official Notion API client."""
 
@@ -80,17 +158,43 @@ class NotionAPIWrapper:
         Args:
             auth_token: Notion Integration token (starts with secret_)
         """
+        # Keep-alive pool shared by all worker threads, so each request reuses a
+        # warm connection instead of paying a new TLS handshake.
+        # notion-client overrides the httpx timeout with timeout_ms.
+        http_client = httpx.Client(
+            http2=HTTP2_AVAILABLE,
+            limits=httpx.Limits(max_keepalive_connections=10, max_connections=20),
+        )
         # Increase timeout for large file uploads and slow blocks (default is 60s)
-        self.client = Client(auth=auth_token, timeout_ms=600000)  # 10 minutes
+        self.client = Client(auth=auth_token, timeout_ms=600000, client=http_client)  # 10 minutes
+        # Same for the raw HTTP calls (database create/query, file uploads).
+        # Pool sized for the upload workers plus the main thread.
+        self._session = requests.Session()
+        self._session.mount(
+            "https://", HTTPAdapter(pool_connections=8, pool_maxsize=16, max_retries=0)
+        )
         self._auth_token = auth_token  # Store for raw API calls
         self._rate_limit_delay = 0.35  # ~3 requests/second
         self._max_retries = 6  # Maximum retry attempts for rate limit errors
         self._max_wait_time = 1500  # 25 minutes in seconds
+        # Shared by every thread using this wrapper: a per-thread delay let
+        # concurrent uploads and page creates burst well past Notion's limit
+        self._request_bucket = TokenBucket(rate=1 / self._rate_limit_delay, capacity=3)
+
+    def _pace(self):
+        """Wait for a slot in the shared ~3 requests/second budget.
+
+        Tokens refill while previous responses are in flight, so a thread
+        that just waited on a slow request (e.g. an append batch) doesn't
+        sleep again on top of it.
+        """
+        self._request_bucket.acquire()
 
     def _retry_on_rate_limit(self, func, *args, **kwargs):
         """Retry a function with exponential backoff ONLY on rate limit errors (429).
         
-        Uses progressive backoff: 1s, 2s, 4s, then 5min intervals.
+        Waits for the 429's Retry-After when given, otherwise uses
+        progressive backoff: 1s, 2s, 4s, then 5min intervals.
         Gives up after 25 minutes total wait time.
         
         Other errors (timeouts, connection issues, 500s, etc.) are raised immediately
@@ -124,11 +228,10 @@ class NotionAPIWrapper:
                     # Not a rate limit error - raise immediately for caller to handle
                     raise
                 
-                # Calculate wait time: 1s, 2s, 4s, then 5min, 5min, 5min
-                if attempt < 3:
-                    wait_time = 2 ** attempt  # 1s, 2s, 4s
-                else:
-                    wait_time = 300  # 5 minutes
+                # Prefer the server's Retry-After; otherwise 1s, 2s, 4s, then 5min, 5min, 5min
+                wait_time = retry_after_seconds(e)
+                if wait_time is None:
+                    wait_time = 2 ** attempt if attempt < 3 else 300
                 
                 # Check if we would exceed max wait time
                 if total_wait_time + wait_time > self._max_wait_time:
@@ -153,6 +256,8 @@ class NotionAPIWrapper:
                     f"Rate limited by Notion API (attempt {attempt + 1}/{self._max_retries}). "
                     f"Waiting {wait_min:.1f} minute{'s' if wait_min != 1 else ''} before retry..."
                 )
+                # Other threads would hit the same limit - hold their requests too
+                self._request_bucket.pause(wait_time)
                 time.sleep(wait_time)
                 total_wait_time += wait_time
         
@@ -170,9 +275,13 @@ class NotionAPIWrapper:
             List of matching page/database objects
         """
         try:
-            # Search without filter to get both pages and databases
+            # Only filter server-side when databases aren't wanted; the search
+            # filter accepts a single object type
             logger.debug(f"Searching for '{title}' (include_databases={include_databases})")
-            response = self._retry_on_rate_limit(self.client.search, query=title)
+            search_args = {"query": title}
+            if not include_databases:
+                search_args["filter"] = {"property": "object", "value": "page"}
+            response = self._retry_on_rate_limit(self.client.search, **search_args)
             results = response.get("results", [])
             logger.debug(f"  Raw search returned {len(results)} results")
             
@@ -217,13 +326,23 @@ class NotionAPIWrapper:
             logger.error(f"Search failed: {e}")
             return []
 
-    def create_page(self, parent_id: str | None, title: str, properties: dict[str, Any] | None = None) -> dict[str, Any]:
+    def create_page(
+        self,
+        parent_id: str | None,
+        title: str,
+        properties: dict[str, Any] | None = None,
+        children: list[dict[str, Any]] | None = None,
+    ) -> dict[str, Any]:
         """Create a new page.
 
+        Up to 100 children are sent inline with the create request (the
+        API's limit); any beyond that are appended afterwards.
+
         Args:
             parent_id: Parent page/database ID
             title: Page title
             properties: Additional properties (for database pages - will replace default)
+            children: Optional initial content blocks
 
         Returns:
             Created page object
@@ -253,8 +372,16 @@ class NotionAPIWrapper:
                 },
             }
 
-        time.sleep(self._rate_limit_delay)
-        return self._retry_on_rate_limit(self.client.pages.create, **page_data)
+        if children:
+            page_data["children"] = children[:100]
+
+        self._pace()
+        page = self._retry_on_rate_limit(self.client.pages.create, **page_data)
+
+        if children and len(children) > 100:
+            self.append_blocks(block_id=page["id"], children=children[100:])
+
+        return page
 
     def create_database(
         self, parent_id: str | None, title: str, properties_schema: dict[str, Any]
@@ -284,7 +411,7 @@ class NotionAPIWrapper:
         
         logger.debug(f"Creating database with {len(properties_schema)} properties")
 
-        time.sleep(self._rate_limit_delay)
+        self._pace()
         
         # Use raw requests API instead of notion-client
         headers = {
@@ -294,7 +421,7 @@ class NotionAPIWrapper:
         }
         
         def _create_db_request():
-            response = requests.post(
+            response = self._session.post(
                 "https://api.notion.com/v1/databases",
                 headers=headers,
                 json=database_data,
@@ -334,7 +461,7 @@ class NotionAPIWrapper:
 
         for i in range(0, len(children), max_batch):
             batch = children[i : i + max_batch]
-            time.sleep(self._rate_limit_delay)
+            self._pace()
 
             try:
                 response = self._retry_on_rate_limit(
@@ -363,7 +490,7 @@ class NotionAPIWrapper:
         Returns:
             Block object
         """
-        time.sleep(self._rate_limit_delay)
+        self._pace()
         return self._retry_on_rate_limit(self.client.blocks.retrieve, block_id=block_id)
 
     def get_database(self, database_id: str) -> dict[str, Any]:
@@ -375,7 +502,7 @@ class NotionAPIWrapper:
         Returns:
             Database object with properties schema
         """
-        time.sleep(self._rate_limit_delay)
+        self._pace()
         return self._retry_on_rate_limit(self.client.databases.retrieve, database_id=database_id)
 
     def get_blocks(self, block_id: str, page_size: int = 100) -> list[dict[str, Any]]:
@@ -392,7 +519,7 @@ class NotionAPIWrapper:
         start_cursor = None
 
         while True:
-            time.sleep(self._rate_limit_delay)
+            self._pace()
 
             params = {"block_id": block_id, "page_size": min(page_size, 100)}
             if start_cursor:
@@ -436,6 +563,40 @@ class NotionAPIWrapper:
 
         return all_blocks
 
+    def list_child_pages(self, parent_id: str) -> list[dict[str, Any]]:
+        """List the direct child pages of a page (no recursion into them).
+
+        Unlike search_pages, this is one paginated listing that is
+        immediately consistent with pages created moments ago.
+
+        Args:
+            parent_id: Parent page ID
+
+        Returns:
+            List of child_page block objects, in page order
+        """
+        child_pages = []
+        start_cursor = None
+
+        while True:
+            self._pace()
+
+            params = {"block_id": parent_id, "page_size": 100}
+            if start_cursor:
+                params["start_cursor"] = start_cursor
+
+            try:
+                response = self._retry_on_rate_limit(self.client.blocks.children.list, **params)
+            except APIResponseError as e:
+                logger.error(f"Failed to list child pages of {parent_id}: {e}")
+                raise
+
+            child_pages.extend(block for block in response.get("results", []) if block.get("type") == "child_page")
+
+            if not response.get("has_more"):
+                return child_pages
+            start_cursor = response.get("next_cursor")
+
     def update_block(self, block_id: str, block_data: dict[str, Any]) -> dict[str, Any]:
         """Update an existing block.
 
@@ -446,7 +607,7 @@ class NotionAPIWrapper:
         Returns:
             Updated block object
         """
-        time.sleep(self._rate_limit_delay)
+        self._pace()
 
         try:
             return self._retry_on_rate_limit(self.client.blocks.update, block_id=block_id, **block_data)
@@ -456,7 +617,7 @@ class NotionAPIWrapper:
 
     def delete_block(self, block_id: str) -> dict[str, Any]:
         """Archive (delete) a block or page by ID."""
-        time.sleep(self._rate_limit_delay)
+        self._pace()
         try:
             return self._retry_on_rate_limit(self.client.blocks.delete, block_id=block_id)
         except APIResponseError as e:
@@ -480,7 +641,7 @@ class NotionAPIWrapper:
 
         try:
             # Get the root page itself
-            time.sleep(self._rate_limit_delay)
+            self._pace()
             root_page = self._retry_on_rate_limit(self.client.pages.retrieve, page_id=root_id)
             root_title = _extract_page_title(root_page)
             if root_title:
@@ -538,7 +699,7 @@ class NotionAPIWrapper:
             
             try:
                 # Get the page itself
-                time.sleep(self._rate_limit_delay)
+                self._pace()
                 page = self._retry_on_rate_limit(self.client.pages.retrieve, page_id=page_id)
                 page_title = _extract_page_title(page) or ""
                 all_pages[page_id] = page_title
@@ -619,7 +780,7 @@ class NotionAPIWrapper:
         batch: dict[str, str] = {}
         start_cursor = None
         while True:
-            time.sleep(self._rate_limit_delay)
+            self._pace()
             try:
                 resp = self._retry_on_rate_limit(self.client.search, start_cursor=start_cursor, page_size=100)
                 results = resp.get("results", [])
@@ -676,7 +837,7 @@ class NotionAPIWrapper:
         start_cursor = None
         
         while True:
-            time.sleep(self._rate_limit_delay)
+            self._pace()
             
             headers = {
                 "Authorization": f"Bearer {self._auth_token}",
@@ -689,7 +850,7 @@ class NotionAPIWrapper:
                 payload["start_cursor"] = start_cursor
             
             def _query_db():
-                response = requests.post(
+                response = self._session.post(
                     f"https://api.notion.com/v1/databases/{database_id}/query",
                     headers=headers,
                     json=payload,
@@ -784,7 +945,7 @@ class NotionAPIWrapper:
         start_cursor = None
 
         while True:
-            time.sleep(self._rate_limit_delay)
+            self._pace()
 
             # Use raw requests API because notion-client's data_sources.query() 
             # doesn't work with database IDs in the current API version
@@ -799,7 +960,7 @@ class NotionAPIWrapper:
                 payload["start_cursor"] = start_cursor
 
             def _query_db():
-                response = requests.post(
+                response = self._session.post(
                     f"https://api.notion.com/v1/databases/{database_id}/query",
                     headers=headers,
                     json=payload,
@@ -893,10 +1054,10 @@ class NotionAPIWrapper:
         
         # Step 1: Create file upload
         logger.debug(f"Creating single-part file upload for {filename} ({len(file_data)} bytes)")
-        time.sleep(self._rate_limit_delay)
+        self._pace()
         
         def _create_upload():
-            response = requests.post(
+            response = self._session.post(
                 "https://api.notion.com/v1/file_uploads",
                 headers=headers,
                 json={
@@ -926,14 +1087,14 @@ class NotionAPIWrapper:
         
         # Step 2: Send file contents
         logger.debug(f"Sending file contents")
-        time.sleep(self._rate_limit_delay)
+        self._pace()
         
         send_headers = {
             "Authorization": f"Bearer {self._auth_token}",
             "Notion-Version": NOTION_API_VERSION,
         }
         
-        send_response = requests.post(
+        send_response = self._session.post(
             f"https://api.notion.com/v1/file_uploads/{upload_id}/send",
             headers=send_headers,
             files={"file": (filename, file_data, mime_type)},
@@ -977,10 +1138,10 @@ class NotionAPIWrapper:
         
         # Step 1: Create multi-part file upload
         logger.debug(f"Creating multi-part file upload for {filename}")
-        time.sleep(self._rate_limit_delay)
+        self._pace()
         
         def _create_multipart():
-            response = requests.post(
+            response = self._session.post(
                 "https://api.notion.com/v1/file_uploads",
                 headers=headers,
                 json={
@@ -1028,9 +1189,9 @@ class NotionAPIWrapper:
             chunk_data = file_data[start:end]
             
             logger.debug(f"  Uploading part {part_num + 1}/{num_chunks} ({len(chunk_data)} bytes)")
-            time.sleep(self._rate_limit_delay)
+            self._pace()
             
-            send_response = requests.post(
+            send_response = self._session.post(
                 f"https://api.notion.com/v1/file_uploads/{upload_id}/send",
                 headers=send_headers,
                 json={"part_number": part_num},
@@ -1049,10 +1210,10 @@ class NotionAPIWrapper:
         
         # Step 3: Complete the multi-part upload
         logger.debug(f"Completing multi-part upload")
-        time.sleep(self._rate_limit_delay)
+        self._pace()
         
         def _complete_multipart():
-            response = requests.post(
+            response = self._session.post(
                 f"https://api.notion.com/v1/file_uploads/{upload_id}/complete",
                 headers=headers,
                 json={},  # Empty body required
@@ -1120,7 +1281,7 @@ def note_to_database_properties(note, database_schema: dict[str, Any] | None = N
         props["URL"] = {"url": note.url}
     
     if note.tags:
-        props["Tags"] = {"multi_select": [{"name": tag} for tag in note.tags]}
+        props["Tags"] = _tags_to_multi_select(note.tags)
     
     # Mark as partial import if there were failures
     if partial_import:
@@ -1129,6 +1290,28 @@ def note_to_database_properties(note, database_schema: dict[str, Any] | None = N
     return props
 
 
+def partial_import_properties(database_schema: dict[str, Any] | None = None) -> dict[str, Any]:
+    """Build the properties update that only sets a row's Partial Import flag.
+
+    Flipping the flag on an existing row doesn't need the title, dates and
+    tags sent again.
+
+    Args:
+        database_schema: Optional existing database schema to adapt to
+
+    Returns:
+        Properties dict for pages.update (empty if the schema has no such checkbox)
+    """
+    if not database_schema:
+        return {"Partial Import": {"checkbox": True}}
+
+    for prop_name, prop_def in database_schema.items():
+        is_checkbox = prop_def.get("type") == "checkbox" or "checkbox" in prop_def
+        if is_checkbox and "partial" in prop_name.lower() and "import" in prop_name.lower():
+            return {prop_name: {"checkbox": True}}
+    return {}
+
+
 def _adapt_to_database_schema(note, database_schema: dict[str, Any], partial_import: bool = False) -> dict[str, Any]:
     """Adapt note properties to match existing database schema.
 
@@ -1178,7 +1361,7 @@ def _adapt_to_database_schema(note, database_schema: dict[str, Any], partial_imp
             elif "update" in prop_name_lower or "edit" in prop_name_lower or "modify" in prop_name_lower:
                 props[prop_name] = {"date": {"start": note.updated.isoformat()}}
         elif prop_type == "multi_select" and note.tags:
-            props[prop_name] = {"multi_select": [{"name": tag} for tag in note.tags]}
+            props[prop_name] = _tags_to_multi_select(note.tags)
         elif prop_type == "checkbox" and "partial" in prop_name.lower() and "import" in prop_name.lower():
             # Handle Partial Import checkbox
             props[prop_name] = {"checkbox": partial_import}
@@ -1186,6 +1369,15 @@ def _adapt_to_database_schema(note, database_schema: dict[str, Any], partial_imp
     return props
 
 
+def _tags_to_multi_select(tags: list[str]) -> dict[str, Any]:
+    """Convert note tags to a multi_select value.
+
+    Duplicate tags are dropped (first occurrence wins) since Notion
+    rejects repeated options in a single multi_select value.
+    """
+    return {"multi_select": [{"name": tag} for tag in dict.fromkeys(tags)]}
+
+
 def _extract_page_title(page: dict[str, Any]) -> str:
     """Extract title from a page object.
 
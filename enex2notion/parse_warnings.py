@@ -3,16 +3,18 @@
 Tracks all material format changes, truncations, and limitations during
 note parsing and conversion to help users understand what was transformed.
 """
-import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
 from typing import Optional
 
-# Thread-local storage for warnings during parsing
-_warnings_context = threading.local()
+# Context-local storage for warnings during parsing
+# (each thread starts with its own empty context, so upload workers don't share lists)
+_warnings_context: ContextVar[Optional[list[str]]] = ContextVar("parse_warnings", default=None)
 
 
 def init_warnings():
-    """Initialize warnings collection for current thread."""
-    _warnings_context.warnings = []
+    """Initialize warnings collection for current context."""
+    _warnings_context.set([])
 
 
 def add_warning(message: str):
@@ -21,23 +23,44 @@ def add_warning(message: str):
     Args:
         message: Warning message describing the transformation
     """
-    if not hasattr(_warnings_context, "warnings"):
-        init_warnings()
-    _warnings_context.warnings.append(message)
+    warnings = _warnings_context.get()
+    if warnings is None:
+        warnings = []
+        _warnings_context.set(warnings)
+    warnings.append(message)
 
 
 def get_warnings() -> list[str]:
-    """Get all collected warnings for current thread.
+    """Get all collected warnings for current context.
     
     Returns:
         List of warning messages
     """
-    if not hasattr(_warnings_context, "warnings"):
+    warnings = _warnings_context.get()
+    if warnings is None:
         return []
-    return _warnings_context.warnings.copy()
+    return warnings.copy()
 
 
 def clear_warnings():
-    """Clear all warnings for current thread."""
-    if hasattr(_warnings_context, "warnings"):
-        _warnings_context.warnings = []
+    """Clear all warnings for current context."""
+    if _warnings_context.get() is not None:
+        _warnings_context.set([])
+
+
+@contextmanager
+def warnings_scope():
+    """Collect warnings into a fresh list for the duration of the block.
+    
+    The previous warnings (if any) are restored on exit, so pooled worker
+    threads don't need a clear/init pair per task.
+    
+    Yields:
+        List that receives warnings added inside the block
+    """
+    warnings = []
+    token = _warnings_context.set(warnings)
+    try:
+        yield warnings
+    finally:
+        _warnings_context.reset(token)
@@ -0,0 +1,102 @@
+from pathlib import Path
+
+import pytest
+
+from enex2notion.cli_upload import DoneFile, EnexUploader
+from enex2notion.enex_types import NoteParseResult, ParseStats
+from enex2notion.utils_static import Rules
+
+
+@pytest.fixture()
+def uploader():
+    rules = Rules(add_meta=False, condense_lines=False, condense_lines_sparse=False, tag="imported")
+    enex_uploader = EnexUploader(None, "root", "PAGE", None, rules)
+    yield enex_uploader
+    enex_uploader.close()
+
+
+@pytest.fixture()
+def fake_notes(mocker):
+    def factory(*titles):
+        notes = [mocker.MagicMock(note_hash=f"hash_{title}", title=title, tags=[]) for title in titles]
+        mocker.patch(
+            "enex2notion.cli_upload.parse_all_notes",
+            return_value=ParseStats(
+                total=len(notes),
+                successful=len(notes),
+                results=[NoteParseResult(note=note, raw_xml=None, error=None, parse_success=True) for note in notes],
+            ),
+        )
+        return notes
+
+    return factory
+
+
+@pytest.fixture()
+def mock_upload_note(mocker):
+    return mocker.patch("enex2notion.cli_upload.upload_note", return_value=("page-id", False, [], {}, {}))
+
+
+def test_done_file_close(tmp_path):
+    done_path = tmp_path / "done.txt"
+
+    done_file = DoneFile(done_path)
+    done_file.add("fake_hash1")
+    done_file.add_database("notebook", "fake_db_id")
+    done_file.close()
+
+    # Writes after close() reopen the file instead of failing
+    done_file.add("fake_hash2")
+    done_file.close()
+
+    reloaded = DoneFile(done_path)
+
+    assert reloaded.done_hashes == {"fake_hash1", "fake_hash2"}
+    assert reloaded.get_database("notebook") == "fake_db_id"
+
+
+def test_done_file_written_before_close(tmp_path):
+    done_path = tmp_path / "done.txt"
+
+    done_file = DoneFile(done_path)
+    done_file.add("fake_hash1")
+
+    # Each record is flushed as written, so an interrupted run keeps it
+    assert done_path.read_text() == "fake_hash1\n"
+
+    done_file.close()
+
+
+def test_done_note_not_converted(uploader, fake_notes, mock_upload_note, mocker):
+    done_note, new_note = fake_notes("done", "new")
+    uploader.done_hashes.add(done_note.note_hash)
+    mock_parse_note = mocker.patch("enex2notion.cli_upload.parse_note", return_value=([], []))
+
+    stats = uploader.upload_notebook(Path("notebook.enex"))
+
+    mock_parse_note.assert_called_once_with(new_note, uploader.rules)
+    assert [call.args[2] for call in mock_upload_note.call_args_list] == [new_note]
+    assert (stats.skipped, stats.successful) == (1, 1)
+    assert done_note.tags == []
+    assert new_note.tags == ["imported"]
+
+
+def test_conversion_exception_reported_for_its_note(uploader, fake_notes, mock_upload_note, mocker):
+    good_note, bad_note, last_note = fake_notes("good", "bad", "last")
+
+    def parse_note(note, rules):
+        if note is bad_note:
+            raise ValueError("broken markup")
+        return [f"{note.title} block"], []
+
+    mocker.patch("enex2notion.cli_upload.parse_note", side_effect=parse_note)
+
+    stats = uploader.upload_notebook(Path("notebook.enex"))
+
+    uploaded = {call.args[2].title: (call.args[3], call.args[4]) for call in mock_upload_note.call_args_list}
+    assert uploaded == {
+        "good": (["good block"], []),
+        "bad": ([], ["Parse exception: broken markup"]),
+        "last": (["last block"], []),
+    }
+    assert stats.successful == 3
@@ -0,0 +1,69 @@
+import pytest
+
+from enex2notion.document_failure_tracker import DOCUMENT_FAILURE_DB_TITLE, FLUSH_BATCH_SIZE, DocumentFailureTracker
+from enex2notion.infrastructure_cache import InfrastructureCache
+
+
+@pytest.fixture()
+def fake_wrapper(mocker):
+    wrapper = mocker.MagicMock()
+    wrapper.search_pages.side_effect = lambda query, include_databases=False: (
+        [{"id": "fresh-exceptions", "parent": {"page_id": "root"}}] if query == "Exceptions" else []
+    )
+    wrapper.create_database.return_value = {"id": "new-db"}
+    return wrapper
+
+
+@pytest.mark.parametrize(
+    "retrieve",
+    [{"return_value": {"in_trash": True}}, {"side_effect": RuntimeError("object_not_found")}],
+)
+def test_stale_cached_exceptions_page_rebuilt(fake_wrapper, tmp_path, retrieve):
+    InfrastructureCache(tmp_path).set_exceptions_page_id("stale-exceptions")
+    fake_wrapper.client.pages.retrieve.configure_mock(**retrieve)
+
+    tracker = DocumentFailureTracker(fake_wrapper, "root", working_dir=tmp_path)
+
+    assert tracker.ensure_db() == "new-db"
+    fake_wrapper.client.pages.retrieve.assert_called_once_with(page_id="stale-exceptions")
+    assert fake_wrapper.create_database.call_args.args[0] == "fresh-exceptions"
+
+    cache = InfrastructureCache(tmp_path)
+    assert cache.get_exceptions_page_id() == "fresh-exceptions"
+    assert cache.get_database_id(DOCUMENT_FAILURE_DB_TITLE) == "new-db"
+
+
+def test_valid_cached_exceptions_page_reused(fake_wrapper, tmp_path):
+    InfrastructureCache(tmp_path).set_exceptions_page_id("cached-exceptions")
+    fake_wrapper.client.pages.retrieve.return_value = {"archived": False, "in_trash": False}
+
+    tracker = DocumentFailureTracker(fake_wrapper, "root", working_dir=tmp_path)
+
+    assert tracker.ensure_db() == "new-db"
+    assert fake_wrapper.create_database.call_args.args[0] == "cached-exceptions"
+    assert all(call.args[0] != "Exceptions" for call in fake_wrapper.search_pages.call_args_list)
+
+
+def _log_failures(tracker, count):
+    for i in range(count):
+        tracker.log_document_failure(f"file{i}.exe", "https://notion.so/x", "Notebook", "Note", "/downloads")
+
+
+def test_rows_written_on_context_exit(fake_wrapper, tmp_path):
+    with DocumentFailureTracker(fake_wrapper, "root", working_dir=tmp_path) as tracker:
+        _log_failures(tracker, FLUSH_BATCH_SIZE - 1)
+        fake_wrapper.create_page.assert_not_called()
+
+    assert fake_wrapper.create_page.call_count == FLUSH_BATCH_SIZE - 1
+
+
+def test_rows_flushed_at_batch_size(fake_wrapper, tmp_path):
+    tracker = DocumentFailureTracker(fake_wrapper, "root", working_dir=tmp_path)
+
+    _log_failures(tracker, FLUSH_BATCH_SIZE + 1)
+
+    assert fake_wrapper.create_page.call_count == FLUSH_BATCH_SIZE
+    assert all(call.kwargs["parent_id"] == "new-db" for call in fake_wrapper.create_page.call_args_list)
+
+    tracker.flush()
+    assert fake_wrapper.create_page.call_count == FLUSH_BATCH_SIZE + 1
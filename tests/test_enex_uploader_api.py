@@ -0,0 +1,149 @@
+from datetime import datetime
+
+import pytest
+from dateutil.tz import tzutc
+
+from enex2notion.enex_types import EvernoteNote, EvernoteResource
+from enex2notion.enex_uploader import APPEND_BATCH_SIZE, upload_note
+from enex2notion.notion_blocks.text import NotionTextBlock, TextProp
+from enex2notion.notion_blocks.uploadable import NotionImageBlock
+from enex2notion.utils_exceptions import NoteUploadFailException
+
+
+@pytest.fixture()
+def fake_wrapper(mocker):
+    wrapper = mocker.MagicMock()
+    wrapper.create_page.return_value = {"id": "page-id"}
+    wrapper.append_blocks.side_effect = lambda block_id, children: [
+        dict(child, id=f"block-{i}") for i, child in enumerate(children)
+    ]
+    return wrapper
+
+
+def _make_note(resources):
+    return EvernoteNote(
+        title="test1",
+        created=datetime(2021, 11, 18, 0, 0, 0, tzinfo=tzutc()),
+        updated=datetime(2021, 11, 18, 0, 0, 0, tzinfo=tzutc()),
+        content="",
+        tags=[],
+        author="",
+        url="",
+        is_webclip=False,
+        is_email=False,
+        resources=resources,
+    )
+
+
+def test_upload_note_duplicate_resource_uploaded_once(fake_wrapper, mocker):
+    mock_upload = mocker.patch(
+        "enex2notion.enex_uploader.upload_image_to_notion",
+        side_effect=lambda resource, *args: f"upload-{resource.md5}",
+    )
+
+    logo = EvernoteResource(data_bin=b"logo", size=4, md5="logo_md5", mime="image/png", file_name="logo.png")
+    photo = EvernoteResource(data_bin=b"photo", size=5, md5="photo_md5", mime="image/png", file_name="photo.png")
+    note_blocks = [
+        NotionImageBlock(md5_hash=logo.md5, resource=logo),
+        NotionImageBlock(md5_hash=photo.md5, resource=photo),
+        NotionImageBlock(md5_hash=logo.md5, resource=logo),
+    ]
+
+    upload_note(fake_wrapper, "root", _make_note([logo, photo]), note_blocks, [])
+
+    assert sorted(call.args[0].md5 for call in mock_upload.call_args_list) == ["logo_md5", "photo_md5"]
+    assert [block.attrs["file_upload_id"] for block in note_blocks] == [
+        "upload-logo_md5",
+        "upload-photo_md5",
+        "upload-logo_md5",
+    ]
+
+
+def test_upload_note_failed_upload_keyed_by_md5(fake_wrapper, mocker):
+    def fake_upload(resource, *args):
+        failed_uploads_list = args[-1]
+        failed_uploads_list.append({"filename": resource.file_name, "path": f"/saved/{resource.file_name}"})
+
+    mocker.patch("enex2notion.enex_uploader.upload_image_to_notion", side_effect=fake_upload)
+
+    setup = EvernoteResource(data_bin=b"exe", size=3, md5="exe_md5", mime="application/x", file_name="setup.exe")
+    note_blocks = [
+        NotionImageBlock(md5_hash=setup.md5, resource=setup),
+        NotionImageBlock(md5_hash=setup.md5, resource=setup),
+    ]
+
+    _, _, _, failed_uploads, user_action_blocks = upload_note(
+        fake_wrapper, "root", _make_note([setup]), note_blocks, []
+    )
+
+    assert failed_uploads == {
+        "exe_md5": {"filename": "setup.exe", "path": "/saved/setup.exe", "block_id": user_action_blocks[0]},
+    }
+    assert len(user_action_blocks) == 2
+
+
+def test_upload_note_create_page_fail_cancels_uploads(fake_wrapper, mocker):
+    fake_pool = mocker.MagicMock()
+    futures = []
+
+    def submit(*args):
+        futures.append(mocker.MagicMock())
+        return futures[-1]
+
+    fake_pool.submit.side_effect = submit
+    mocker.patch("enex2notion.enex_uploader._get_upload_pool", return_value=fake_pool)
+    fake_wrapper.create_page.side_effect = RuntimeError("create failed")
+
+    logo = EvernoteResource(data_bin=b"logo", size=4, md5="logo_md5", mime="image/png", file_name="logo.png")
+    photo = EvernoteResource(data_bin=b"photo", size=5, md5="photo_md5", mime="image/png", file_name="photo.png")
+    note_blocks = [
+        NotionImageBlock(md5_hash=logo.md5, resource=logo),
+        NotionImageBlock(md5_hash=photo.md5, resource=photo),
+    ]
+
+    with pytest.raises(NoteUploadFailException):
+        upload_note(fake_wrapper, "root", _make_note([logo, photo]), note_blocks, [])
+
+    assert len(futures) == 2
+    for future in futures:
+        future.cancel.assert_called_once()
+        future.result.assert_not_called()
+    fake_wrapper.append_blocks.assert_not_called()
+
+
+def _summary_callouts(blocks):
+    return [
+        block
+        for block in blocks
+        if block["type"] == "callout" and block["callout"]["icon"].get("emoji") == "⚠️"
+    ]
+
+
+def test_upload_note_current_summary_not_duplicated(fake_wrapper):
+    note_blocks = [NotionTextBlock(text_prop=TextProp(f"line {i}")) for i in range(APPEND_BATCH_SIZE + 50)]
+
+    upload_note(fake_wrapper, "root", _make_note([]), note_blocks, ["parse error"])
+
+    batches = [call.kwargs["children"] for call in fake_wrapper.append_blocks.call_args_list]
+    assert [len(batch) for batch in batches] == [APPEND_BATCH_SIZE, 51]
+    assert _summary_callouts(batches[0]) == [batches[0][0]]
+    assert _summary_callouts(batches[1]) == []
+    fake_wrapper.client.pages.update.assert_not_called()
+
+
+def test_upload_note_partial_flag_set_once(fake_wrapper):
+    fake_wrapper.append_blocks.side_effect = [
+        [{"id": "block-0", "type": "paragraph"}],
+        RuntimeError("validation_error"),
+    ]
+    note_blocks = [NotionTextBlock(text_prop=TextProp(f"line {i}")) for i in range(APPEND_BATCH_SIZE + 1)]
+
+    _, has_errors, errors, _, _ = upload_note(
+        fake_wrapper, "root", _make_note([]), note_blocks, [], is_database=True
+    )
+
+    assert has_errors
+    assert errors == ["Failed to upload blocks: validation_error"]
+    fake_wrapper.client.pages.update.assert_called_once_with(
+        page_id="page-id", properties={"Partial Import": {"checkbox": True}}
+    )
@@ -0,0 +1,119 @@
+import pytest
+
+from enex2notion.exception_tracker import PARTIAL_IMPORT_BATCH_SIZE, ExceptionTracker
+
+
+@pytest.fixture()
+def fake_wrapper(mocker):
+    wrapper = mocker.MagicMock()
+    wrapper.client.pages.retrieve.return_value = {"archived": False, "in_trash": False}
+    wrapper.list_child_pages.return_value = []
+    wrapper.create_page.side_effect = lambda parent_id, title, **kwargs: {"id": f"page-{title}"}
+    wrapper.append_blocks.side_effect = lambda block_id, children: [
+        dict(child, id=f"block-{i}") for i, child in enumerate(children)
+    ]
+    return wrapper
+
+
+@pytest.fixture()
+def tracker(fake_wrapper, tmp_path):
+    return ExceptionTracker(fake_wrapper, "root", working_dir=tmp_path)
+
+
+def _track_partial_imports(tracker, count, start=0):
+    for i in range(start, start + count):
+        tracker.track_partial_import("test.enex", f"note{i}", f"note-page-{i}", ["error"])
+
+
+def _notebook_page_children(fake_wrapper):
+    return [
+        call.kwargs["children"]
+        for call in fake_wrapper.create_page.call_args_list
+        if call.kwargs["title"] == "test.enex"
+    ]
+
+
+def test_partial_imports_buffered_below_batch_size(tracker, fake_wrapper):
+    _track_partial_imports(tracker, PARTIAL_IMPORT_BATCH_SIZE - 1)
+
+    assert _notebook_page_children(fake_wrapper) == []
+    fake_wrapper.append_blocks.assert_not_called()
+
+
+def test_partial_imports_flushed_at_batch_size(tracker, fake_wrapper):
+    _track_partial_imports(tracker, PARTIAL_IMPORT_BATCH_SIZE)
+
+    # The page is created with the intro and the whole batch inline
+    created = _notebook_page_children(fake_wrapper)
+    assert len(created) == 1
+    assert len([b for b in created[0] if b["type"] == "bulleted_list_item"]) == PARTIAL_IMPORT_BATCH_SIZE
+    fake_wrapper.append_blocks.assert_not_called()
+
+    _track_partial_imports(tracker, 1, start=PARTIAL_IMPORT_BATCH_SIZE)
+    fake_wrapper.append_blocks.assert_not_called()
+
+    tracker.flush_partial_imports("test.enex")
+
+    fake_wrapper.append_blocks.assert_called_once()
+    assert fake_wrapper.append_blocks.call_args.kwargs["block_id"] == "page-test.enex"
+    assert len(fake_wrapper.append_blocks.call_args.kwargs["children"]) == 1
+
+
+def test_partial_imports_existing_page_appended_in_batches(tracker, fake_wrapper):
+    fake_wrapper.list_child_pages.side_effect = lambda parent_id: (
+        [{"id": "existing-page", "child_page": {"title": "test.enex"}}] if parent_id == "page-Exceptions" else []
+    )
+
+    _track_partial_imports(tracker, PARTIAL_IMPORT_BATCH_SIZE * 2 + 1)
+    tracker.flush_partial_imports()
+
+    assert _notebook_page_children(fake_wrapper) == []
+    assert [
+        (call.kwargs["block_id"], len(call.kwargs["children"]))
+        for call in fake_wrapper.append_blocks.call_args_list
+    ] == [
+        ("existing-page", PARTIAL_IMPORT_BATCH_SIZE),
+        ("existing-page", PARTIAL_IMPORT_BATCH_SIZE),
+        ("existing-page", 1),
+    ]
+
+
+def test_partial_imports_dedup(tracker, fake_wrapper):
+    tracker.track_partial_import("test.enex", "note", "note-page", ["error"])
+    tracker.track_partial_import("test.enex", "note", "note-page", ["error"])
+
+    tracker.flush_partial_imports()
+
+    created = _notebook_page_children(fake_wrapper)
+    assert len([b for b in created[0] if b["type"] == "bulleted_list_item"]) == 1
+
+
+def test_unmatched_link_dedup_by_block_id(tracker, fake_wrapper):
+    for block_id in ("block1", "block1", "block2"):
+        tracker.track_unmatched_link("Source", "source-page", "Target", "evernote:///view/1", block_id=block_id)
+
+    tracker.flush()
+
+    fake_wrapper.append_blocks.assert_called_once()
+    assert fake_wrapper.append_blocks.call_args.kwargs["block_id"] == "page-EvernoteLinkFailure"
+    entries = fake_wrapper.append_blocks.call_args.kwargs["children"]
+    assert len(entries) == 2
+    assert all(entry["type"] == "toggle" for entry in entries)
+
+
+
+def test_flush_failure_summary_reported_once(tracker, fake_wrapper, caplog):
+    def create_page(parent_id, title, **kwargs):
+        if title != "Exceptions":
+            raise RuntimeError("validation_error")
+        return {"id": "page-Exceptions"}
+
+    fake_wrapper.create_page.side_effect = create_page
+    for i in range(6):
+        tracker.track_partial_import(f"notebook{i}.enex", "note", f"note-page-{i}", ["error"])
+
+    tracker.flush()
+    tracker.flush()
+
+    summaries = [record.getMessage() for record in caplog.records if "failed in total" in record.getMessage()]
+    assert summaries == ["6 partial import write(s) failed in total (1 not shown above; see debug log)"]
@@ -0,0 +1,146 @@
+import threading
+
+import pytest
+from notion_client.errors import RequestTimeoutError, UnknownHTTPResponseError
+
+from enex2notion.notion_api_wrapper import TokenBucket, retry_on_transient_errors
+
+
+class FakeClock(object):
+    """Stands in for the time module; sleep() records the wait and, unless frozen, advances the clock."""
+
+    def __init__(self, frozen=False):
+        self.now = 0.0
+        self.frozen = frozen
+        self.sleeps = []
+        self._lock = threading.Lock()
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        with self._lock:
+            self.sleeps.append(seconds)
+            if not self.frozen:
+                self.now += seconds
+
+
+@pytest.fixture()
+def mock_sleep(mocker):
+    return mocker.patch("enex2notion.notion_api_wrapper.time.sleep")
+
+
+def test_retry_on_transient_errors_bad_gateway(mocker, mock_sleep):
+    func = mocker.Mock(side_effect=[UnknownHTTPResponseError(502), "ok"])
+
+    assert retry_on_transient_errors(func) == "ok"
+    assert func.call_count == 2
+    mock_sleep.assert_called_once()
+
+
+@pytest.mark.parametrize("status", [400, 429])
+def test_retry_on_transient_errors_not_retried(mocker, mock_sleep, status):
+    func = mocker.Mock(side_effect=UnknownHTTPResponseError(status))
+
+    with pytest.raises(UnknownHTTPResponseError):
+        retry_on_transient_errors(func)
+
+    func.assert_called_once()
+    mock_sleep.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    "error",
+    [RequestTimeoutError(), UnknownHTTPResponseError(502), UnknownHTTPResponseError(504)],
+)
+def test_retry_on_transient_errors_not_idempotent(mocker, mock_sleep, error):
+    func = mocker.Mock(side_effect=[error, "ok"])
+
+    with pytest.raises(type(error)):
+        retry_on_transient_errors(func, idempotent=False)
+
+    func.assert_called_once()
+    mock_sleep.assert_not_called()
+
+
+def test_retry_on_transient_errors_not_idempotent_unavailable(mocker, mock_sleep):
+    func = mocker.Mock(side_effect=[UnknownHTTPResponseError(503), "ok"])
+
+    assert retry_on_transient_errors(func, idempotent=False) == "ok"
+    assert func.call_count == 2
+
+
+@pytest.fixture()
+def fake_clock(mocker):
+    clock = FakeClock()
+    mocker.patch("enex2notion.notion_api_wrapper.time", clock)
+    return clock
+
+
+def test_token_bucket_capacity(fake_clock):
+    bucket = TokenBucket(rate=2, capacity=3)
+
+    for _ in range(3):
+        bucket.acquire()
+    assert fake_clock.sleeps == []
+
+    bucket.acquire()
+    assert fake_clock.sleeps == [0.5]
+
+
+def test_token_bucket_refill(fake_clock):
+    bucket = TokenBucket(rate=2, capacity=3)
+    for _ in range(3):
+        bucket.acquire()
+
+    fake_clock.now += 1
+    bucket.acquire()
+    bucket.acquire()
+    assert fake_clock.sleeps == []
+
+    bucket.acquire()
+    assert fake_clock.sleeps == [0.5]
+
+
+def test_token_bucket_refill_capped(fake_clock):
+    bucket = TokenBucket(rate=2, capacity=3)
+
+    fake_clock.now += 100
+    for _ in range(4):
+        bucket.acquire()
+
+    assert fake_clock.sleeps == [0.5]
+
+
+def test_token_bucket_pause(fake_clock):
+    bucket = TokenBucket(rate=2, capacity=3)
+
+    bucket.pause(2)
+    bucket.acquire()
+
+    assert fake_clock.sleeps == [2]
+
+
+def test_token_bucket_pause_elapsed(fake_clock):
+    bucket = TokenBucket(rate=2, capacity=3)
+
+    bucket.pause(2)
+    fake_clock.now += 2
+    bucket.acquire()
+
+    assert fake_clock.sleeps == []
+
+
+def test_token_bucket_concurrent_acquire(mocker):
+    clock = FakeClock(frozen=True)
+    mocker.patch("enex2notion.notion_api_wrapper.time", clock)
+    bucket = TokenBucket(rate=2, capacity=3)
+
+    threads = [threading.Thread(target=bucket.acquire) for _ in range(10)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # Three burst tokens, then every thread gets its own half-second slot
+    assert sorted(clock.sleeps) == [0.5 * slot for slot in range(1, 8)]